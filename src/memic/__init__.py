@@ -1,6 +1,7 @@
 """Memic Python SDK - File uploads and semantic search for context engineering."""
 
 from ._version import __version__
+from .async_client import AsyncMemic
 from .client import Memic
 from .exceptions import APIError, AuthenticationError, MemicError, NotFoundError
 from .types import (
@@ -22,6 +23,7 @@ __all__ = [
     "__version__",
     # Client
     "Memic",
+    "AsyncMemic",
     # Types
     "ColumnInfo",
     "File",
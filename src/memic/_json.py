@@ -0,0 +1,16 @@
+"""JSON decoding with an optional orjson fast path."""
+
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+_loads: Callable[[Union[bytes, str]], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    return _loads(data)
@@ -0,0 +1,467 @@
+"""Async Memic client for concurrent uploads and searches."""
+
+import asyncio
+import os
+import random
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Type
+
+from ._json import loads as json_loads
+from ._version import __version__
+from .client import (
+    Memic,
+    ProgressCallback,
+    UploadSource,
+    _build_init_payload,
+    _error_message,
+    _open_upload_source,
+    _parse_search_response,
+    _processing_error,
+)
+from .exceptions import APIError, AuthenticationError, MemicError, NotFoundError
+from .types import File, FileStatus, MetadataFilters, Project, SearchResults
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    import aiohttp
+
+
+class AsyncMemic:
+    """Asyncio twin of :class:`Memic` backed by a pooled ``aiohttp`` session.
+
+    Requires the optional ``aiohttp`` dependency (``pip install "memic[async]"``).
+    All calls share one connection pool, so many uploads or searches can be
+    awaited concurrently on a single event loop.
+
+    Example:
+        >>> import asyncio
+        >>> from memic import AsyncMemic
+        >>>
+        >>> async def main() -> None:
+        ...     async with AsyncMemic() as client:
+        ...         files = await asyncio.gather(
+        ...             *(client.upload_file(p) for p in ["a.pdf", "b.pdf"])
+        ...         )
+        ...         results = await client.search(query="key findings")
+    """
+
+    DEFAULT_BASE_URL = Memic.DEFAULT_BASE_URL
+    DEFAULT_TIMEOUT = Memic.DEFAULT_TIMEOUT
+    DEFAULT_POLL_INTERVAL = Memic.DEFAULT_POLL_INTERVAL
+    DEFAULT_POLL_TIMEOUT = Memic.DEFAULT_POLL_TIMEOUT
+    DEFAULT_MAX_POLL_INTERVAL = Memic.DEFAULT_MAX_POLL_INTERVAL
+    POLL_BACKOFF_FACTOR = Memic.POLL_BACKOFF_FACTOR
+    LONG_POLL_WAIT = Memic.LONG_POLL_WAIT
+    LONG_POLL_GRACE = Memic.LONG_POLL_GRACE
+    UPLOAD_CHUNK_SIZE = Memic.UPLOAD_CHUNK_SIZE
+    UPLOAD_READ_BUFFER = Memic.UPLOAD_READ_BUFFER
+    CONNECTOR_LIMIT = 64
+    CONNECTOR_LIMIT_PER_HOST = 32
+    KEEPALIVE_TIMEOUT = 75
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initialize the async Memic client.
+
+        The underlying ``aiohttp.ClientSession`` is created lazily on the
+        first request, so the client can be constructed outside a running
+        event loop.
+
+        Args:
+            api_key: Memic API key. If not provided, reads from MEMIC_API_KEY env var.
+            base_url: Override the API base URL (for development/testing).
+            timeout: Request timeout in seconds (default: 30).
+
+        Raises:
+            ImportError: If aiohttp is not installed.
+            AuthenticationError: If no API key is provided or found in environment.
+        """
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "AsyncMemic requires aiohttp. Install it with: pip install 'memic[async]'"
+            ) from None
+
+        self.api_key = api_key or os.environ.get("MEMIC_API_KEY")
+        if not self.api_key:
+            raise AuthenticationError(
+                "No API key provided. Pass api_key parameter or set MEMIC_API_KEY env var."
+            )
+
+        self.base_url = (
+            base_url or os.environ.get("MEMIC_BASE_URL") or self.DEFAULT_BASE_URL
+        ).rstrip("/")
+        self.timeout = timeout
+        # Sent per API request rather than on the session, so presigned
+        # storage PUTs sharing the pool never receive the API key.
+        self._headers = {
+            "X-API-Key": self.api_key,
+            "User-Agent": f"memic-python/{__version__}",
+        }
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def __aenter__(self) -> "AsyncMemic":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional["TracebackType"],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the pooled session, creating it on first use."""
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.CONNECTOR_LIMIT,
+                    limit_per_host=self.CONNECTOR_LIMIT_PER_HOST,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Make an HTTP request to the API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE).
+            path: API path (will be prefixed with base_url).
+            json: JSON body for POST/PUT requests.
+            params: Query parameters.
+            timeout: Per-call timeout override in seconds (default: client timeout).
+
+        Returns:
+            Parsed JSON response.
+
+        Raises:
+            AuthenticationError: For 401/403 responses.
+            NotFoundError: For 404 responses.
+            APIError: For other error responses.
+        """
+        return await self._request_url(method, self.base_url + path, json, params, timeout)
+
+    async def _request_url(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Like ``_request`` but with a prebuilt absolute URL."""
+        import aiohttp
+
+        session = self._get_session()
+
+        try:
+            async with session.request(
+                method,
+                url,
+                json=json,
+                params=params,
+                headers=self._headers,
+                timeout=aiohttp.ClientTimeout(total=timeout or self.timeout),
+            ) as response:
+                status_code = response.status
+                body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise APIError(f"Request failed: {e}")
+
+        if status_code == 401 or status_code == 403:
+            raise AuthenticationError(_error_message(_decode(body), status_code))
+        elif status_code == 404:
+            raise NotFoundError(_error_message(_decode(body), status_code))
+        elif status_code >= 400:
+            text = _decode(body)
+            raise APIError(
+                _error_message(text, status_code),
+                status_code=status_code,
+                response_body=text,
+            )
+
+        if status_code == 204:
+            return {}
+
+        result: Dict[str, Any] = json_loads(body)
+        return result
+
+    async def list_projects(self) -> List[Project]:
+        """List all projects in the organization.
+
+        Returns:
+            List of Project objects.
+        """
+        response = await self._request("GET", "/sdk/projects")
+        if isinstance(response, list):
+            return [Project.model_validate(p) for p in response]
+        return []
+
+    async def upload_file(
+        self,
+        file_path: UploadSource,
+        wait_for_ready: bool = True,
+        reference_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        poll_timeout: float = DEFAULT_POLL_TIMEOUT,
+        progress_callback: Optional[ProgressCallback] = None,
+        filename: Optional[str] = None,
+        mime_type: Optional[str] = None,
+    ) -> File:
+        """Upload a file using the 3-step presigned URL flow.
+
+        Args:
+            file_path: Path to the file to upload, or its content as ``bytes``
+                or a seekable binary file object.
+            wait_for_ready: If True, poll until file is READY (default: True).
+            reference_id: Optional reference ID for external system linking.
+            metadata: Optional metadata key-value pairs.
+            poll_interval: Initial seconds between status polls (default: 2.0).
+            poll_timeout: Max seconds to wait for READY status (default: 300).
+            progress_callback: Optional ``callback(bytes_sent, total_bytes)``
+                invoked as each chunk is streamed to storage.
+            filename: Name to upload under; required for ``bytes``.
+            mime_type: Content type. Defaults to a guess from the filename.
+
+        Returns:
+            File object with current status.
+
+        Raises:
+            FileNotFoundError: If file_path doesn't exist.
+            ValueError: If no filename can be determined for bytes/file objects,
+                or a file object is not seekable.
+            MemicError: If file processing fails.
+        """
+        import aiohttp
+
+        session = self._get_session()
+        with _open_upload_source(
+            file_path, filename, mime_type, self.UPLOAD_READ_BUFFER
+        ) as source:
+            # Step 1: Initialize upload
+            init_response = await self._request(
+                "POST",
+                "/sdk/files/init",
+                json=_build_init_payload(source, reference_id, metadata),
+            )
+
+            file_id = init_response["file_id"]
+            upload_url = init_response["upload_url"]
+
+            # Step 2: PUT file to presigned URL
+            try:
+                async with session.put(
+                    upload_url,
+                    data=_file_sender(
+                        source.fileobj, source.size, self.UPLOAD_CHUNK_SIZE, progress_callback
+                    ),
+                    headers={
+                        "Content-Type": source.mime_type,
+                        "Content-Length": str(source.size),
+                    },
+                    timeout=aiohttp.ClientTimeout(total=self.timeout * 10),
+                ) as put_response:
+                    if put_response.status >= 400:
+                        raise APIError(
+                            f"Failed to upload file to storage: {await put_response.text()}",
+                            status_code=put_response.status,
+                        )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise APIError(f"Request failed: {e}")
+
+        # Step 3: Confirm upload
+        confirm_response = await self._request("POST", f"/sdk/files/{file_id}/confirm")
+
+        file = File.model_validate(confirm_response)
+
+        if wait_for_ready:
+            file = await self.wait_for_ready(
+                file_id=file.id,
+                poll_interval=poll_interval,
+                poll_timeout=poll_timeout,
+            )
+
+        return file
+
+    async def get_file_status(self, file_id: str, wait_seconds: Optional[int] = None) -> File:
+        """Get the current status of a file.
+
+        Args:
+            file_id: File ID to check.
+            wait_seconds: If set, ask the server to hold the request (long-poll)
+                for up to this many seconds until the status changes.
+
+        Returns:
+            File object with current status.
+        """
+        return File.model_validate(await self._request_file_status(file_id, wait_seconds))
+
+    def _status_url(self, file_id: str) -> str:
+        """Absolute URL of a file's status endpoint."""
+        return "%s/sdk/files/%s/status" % (self.base_url, file_id)
+
+    async def _request_file_status(
+        self,
+        file_id: str,
+        wait_seconds: Optional[int] = None,
+        url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Fetch the raw status payload for a file (see ``get_file_status``)."""
+        params = None
+        timeout = None
+        if wait_seconds is not None:
+            params = {"wait": wait_seconds}
+            # Extend the configured timeout to cover the hold, never shorten it
+            timeout = max(self.timeout, wait_seconds + self.LONG_POLL_GRACE)
+        return await self._request_url(
+            "GET", url or self._status_url(file_id), params=params, timeout=timeout
+        )
+
+    async def wait_for_ready(
+        self,
+        file_id: str,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        poll_timeout: float = DEFAULT_POLL_TIMEOUT,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> File:
+        """Wait for a file to reach READY status.
+
+        Uses the same backoff schedule as :meth:`Memic.wait_for_ready`.
+
+        Args:
+            file_id: File ID to wait for.
+            poll_interval: Initial seconds between status checks (default: 2.0).
+            poll_timeout: Max seconds to wait (default: 300).
+            max_poll_interval: Upper bound on the backed-off interval (default: 15.0).
+
+        Returns:
+            File object with READY status.
+
+        Raises:
+            MemicError: If file processing fails or timeout is reached.
+        """
+        start_time = time.time()
+        attempt = 0
+        last_status: Optional[FileStatus] = None
+        status_url = self._status_url(file_id)
+
+        while True:
+            poll_started = time.time()
+            remaining = poll_timeout - (poll_started - start_time)
+            response = await self._request_file_status(
+                file_id,
+                wait_seconds=max(1, int(min(self.LONG_POLL_WAIT, remaining))),
+                url=status_url,
+            )
+
+            status = FileStatus(response.get("status", FileStatus.UPLOADING.value))
+            if status is FileStatus.READY:
+                return File.model_validate(response)
+
+            if status.is_failed:
+                raise _processing_error(status, response.get("error_message"))
+
+            elapsed = time.time() - start_time
+            if elapsed >= poll_timeout:
+                raise MemicError(
+                    f"Timeout waiting for file to be ready. "
+                    f"Current status: {status.value}"
+                )
+
+            if status != last_status:
+                attempt = 0
+                last_status = status
+
+            delay = min(max_poll_interval, poll_interval * (self.POLL_BACKOFF_FACTOR ** attempt))
+            delay += random.uniform(0, 0.25)
+            delay -= time.time() - poll_started
+            if delay > 0:
+                await asyncio.sleep(min(delay, poll_timeout - elapsed))
+            attempt += 1
+
+    async def search(
+        self,
+        query: str,
+        project_id: Optional[str] = None,
+        file_ids: Optional[List[str]] = None,
+        top_k: int = 10,
+        min_score: float = 0.7,
+        filters: Optional[MetadataFilters] = None,
+    ) -> SearchResults:
+        """Search for content across documents.
+
+        Args:
+            query: Search query text.
+            project_id: Optional project ID to limit search scope.
+            file_ids: Optional list of file IDs to search within.
+            top_k: Number of results to return (default: 10, max: 50).
+            min_score: Minimum similarity score threshold (default: 0.7).
+            filters: Optional metadata filters (reference_id, page_number, etc.).
+
+        Returns:
+            SearchResults object containing matching chunks.
+        """
+        payload: Dict[str, Any] = {
+            "query": query,
+            "top_k": top_k,
+            "min_score": min_score,
+        }
+
+        if project_id:
+            payload["project_id"] = project_id
+        if file_ids:
+            payload["file_ids"] = file_ids
+        if filters:
+            payload["metadata_filters"] = filters.to_api_format()
+
+        response = await self._request("POST", "/sdk/search", json=payload)
+        return _parse_search_response(response, query)
+
+
+def _decode(body: bytes) -> str:
+    """Decode a response body for error reporting."""
+    return body.decode("utf-8", errors="replace")
+
+
+async def _file_sender(
+    fileobj: Any,
+    size: int,
+    chunk_size: int,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> AsyncIterator[bytes]:
+    """Yield a file in chunks, reading off the event loop."""
+    loop = asyncio.get_running_loop()
+    bytes_sent = 0
+    while True:
+        chunk = await loop.run_in_executor(None, fileobj.read, chunk_size)
+        if not chunk:
+            break
+        bytes_sent += len(chunk)
+        if progress_callback is not None:
+            progress_callback(bytes_sent, size)
+        yield chunk
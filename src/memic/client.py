@@ -1,17 +1,39 @@
 """Main Memic client for interacting with the API."""
 
+import contextlib
+import functools
+import io
 import mimetypes
 import os
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    overload,
+)
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from ._json import loads as json_loads
 from ._version import __version__
 from .exceptions import APIError, AuthenticationError, MemicError, NotFoundError
 from .types import (
-    ColumnInfo,
     File,
     FileStatus,
     MetadataFilters,
@@ -23,6 +45,84 @@ from .types import (
     StructuredResult,
 )
 
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    import httpx
+
+ProgressCallback = Callable[[int, int], None]
+UploadSource = Union[str, Path, BinaryIO, bytes]
+_SendFunc = Callable[
+    [str, str, Optional[Dict[str, Any]], Optional[Dict[str, Any]], float],
+    Union[requests.Response, "httpx.Response"],
+]
+
+# Statuses retried for idempotent requests (GET/PUT/DELETE)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# POSTs such as /sdk/files/init may already have taken effect on a 500/502/504,
+# so they are only replayed when the server refused them outright
+_POST_RETRY_STATUSES = frozenset({429, 503})
+# Longest Retry-After (seconds) honored per retry; urllib3 itself has no cap
+_RETRY_AFTER_MAX = 30
+
+
+class _ApiRetry(Retry):
+    """Retry policy that replays POSTs only on 429/503.
+
+    Idempotent methods are retried on every status in ``status_forcelist`` and
+    on read errors. POSTs are left out of ``allowed_methods`` so a read error
+    (the request may have been processed) is never replayed; connect errors,
+    which happen before anything is sent, are retried for all methods.
+    A ``Retry-After`` header is honored up to ``_RETRY_AFTER_MAX`` seconds.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return status_code in _POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _RETRY_AFTER_MAX)
+
+
+class _UploadBody:
+    """Sized iterator over a file for presigned PUT uploads.
+
+    Exposing ``__len__`` lets requests emit a ``Content-Length`` header
+    (presigned URLs reject chunked transfer-encoding), while iterating in
+    large chunks keeps read/send syscalls low and memory constant for big
+    files. ``progress_callback(bytes_sent, total)`` is called per chunk.
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        size: int,
+        chunk_size: int,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> None:
+        self._fileobj = fileobj
+        self._size = size
+        self._chunk_size = chunk_size
+        self._progress_callback = progress_callback
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[bytes]:
+        bytes_sent = 0
+        while True:
+            chunk = self._fileobj.read(self._chunk_size)
+            if not chunk:
+                break
+            bytes_sent += len(chunk)
+            if self._progress_callback is not None:
+                self._progress_callback(bytes_sent, self._size)
+            yield chunk
+
 
 class Memic:
     """Memic SDK client for file uploads and semantic search.
@@ -49,12 +149,29 @@ class Memic:
     DEFAULT_TIMEOUT = 30
     DEFAULT_POLL_INTERVAL = 2.0
     DEFAULT_POLL_TIMEOUT = 300
+    DEFAULT_MAX_POLL_INTERVAL = 15.0
+    POLL_BACKOFF_FACTOR = 1.5
+    LONG_POLL_WAIT = 30
+    LONG_POLL_GRACE = 5  # read timeout slack on top of the server-side wait
+    DEFAULT_MAX_RETRIES = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    DEFAULT_POOL_CONNECTIONS = 32
+    DEFAULT_POOL_MAXSIZE = 64
+    HTTPX_MAX_CONNECTIONS = 64
+    HTTPX_MAX_KEEPALIVE_CONNECTIONS = 32
+    UPLOAD_POOL_CONNECTIONS = 8
+    UPLOAD_POOL_MAXSIZE = 32
+    UPLOAD_CHUNK_SIZE = 4 << 20  # 4 MiB
+    UPLOAD_READ_BUFFER = 1 << 20  # 1 MiB
+    DEFAULT_MAX_CONCURRENCY = 8
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT,
+        organization_id: Optional[str] = None,
+        transport: Literal["requests", "httpx"] = "requests",
     ) -> None:
         """Initialize the Memic client.
 
@@ -62,9 +179,21 @@ class Memic:
             api_key: Memic API key. If not provided, reads from MEMIC_API_KEY env var.
             base_url: Override the API base URL (for development/testing).
             timeout: Request timeout in seconds (default: 30).
+            organization_id: Known organization ID, returned by ``org_id`` without
+                a ``/sdk/me`` request. API calls never need it (the server resolves
+                the organization from the API key), so this only saves a round trip
+                for code that reads ``client.org_id``. It is not checked against the key.
+            transport: HTTP backend for API calls. ``"requests"`` (default) or
+                ``"httpx"``, which multiplexes concurrent calls over HTTP/2
+                (requires ``pip install "memic[http2]"``). Both retry connect
+                errors and transient 429/5xx responses (POSTs only on 429/503);
+                only ``"requests"`` also retries read errors on idempotent
+                calls. Presigned uploads always use requests.
 
         Raises:
             AuthenticationError: If no API key is provided or found in environment.
+            ImportError: If ``transport="httpx"`` and httpx/h2 are not installed.
+            ValueError: If ``transport`` is not a known backend.
         """
         self.api_key = api_key or os.environ.get("MEMIC_API_KEY")
         if not self.api_key:
@@ -72,22 +201,107 @@ class Memic:
                 "No API key provided. Pass api_key parameter or set MEMIC_API_KEY env var."
             )
 
-        self.base_url = (base_url or os.environ.get("MEMIC_BASE_URL") or self.DEFAULT_BASE_URL).rstrip("/")
+        self.base_url = (
+            base_url or os.environ.get("MEMIC_BASE_URL") or self.DEFAULT_BASE_URL
+        ).rstrip("/")
         self.timeout = timeout
-        self._org_id: Optional[str] = None
+        self._org_id: Optional[str] = organization_id
         self._project_id: Optional[str] = None
         self._env_slug: Optional[str] = None
+        self._context_loaded = False
+        self._batch_status_supported = True
 
-        self._session = requests.Session()
-        self._session.headers.update({
+        headers = {
             "X-API-Key": self.api_key,
             "User-Agent": f"memic-python/{__version__}",
-            "Content-Type": "application/json",
-        })
+        }
+        self._session = requests.Session()
+        self._session.headers.update(headers)
+        adapter = HTTPAdapter(
+            pool_connections=self.DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=self.DEFAULT_POOL_MAXSIZE,
+            pool_block=False,
+            max_retries=_ApiRetry(
+                total=self.DEFAULT_MAX_RETRIES,
+                backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                status_forcelist=_RETRY_STATUSES,
+                allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+                # Hand the final response back so _request maps it to an exception
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Presigned storage URLs must not receive the API key, so uploads
+        # go through their own pooled session.
+        self._upload_session = requests.Session()
+        upload_adapter = HTTPAdapter(
+            pool_connections=self.UPLOAD_POOL_CONNECTIONS,
+            pool_maxsize=self.UPLOAD_POOL_MAXSIZE,
+        )
+        self._upload_session.mount("https://", upload_adapter)
+        self._upload_session.mount("http://", upload_adapter)
+
+        # Pick the API backend once here rather than branching per request
+        self._httpx_client: Optional["httpx.Client"] = None
+        self._send: _SendFunc
+        if transport == "httpx":
+            self._httpx_client = self._build_httpx_client(headers)
+            import httpx
+
+            self._httpx_error: Type[Exception] = httpx.HTTPError
+            self._send = self._send_httpx
+        elif transport == "requests":
+            self._send = self._send_requests
+        else:
+            raise ValueError(f"Unknown transport {transport!r}; use 'requests' or 'httpx'")
+
+    def __enter__(self) -> "Memic":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional["TracebackType"],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP sessions and their pooled connections."""
+        self._session.close()
+        self._upload_session.close()
+        if self._httpx_client is not None:
+            self._httpx_client.close()
+
+    def _build_httpx_client(self, headers: Dict[str, str]) -> "httpx.Client":
+        """Create the HTTP/2 httpx client used when ``transport="httpx"``."""
+        try:
+            import h2  # noqa: F401
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "transport='httpx' requires httpx with HTTP/2 support. "
+                "Install it with: pip install 'memic[http2]'"
+            ) from None
+
+        return httpx.Client(
+            headers=headers,
+            timeout=self.timeout,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.HTTPX_MAX_CONNECTIONS,
+                    max_keepalive_connections=self.HTTPX_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                retries=self.DEFAULT_MAX_RETRIES,
+            ),
+        )
 
     def _ensure_context(self) -> None:
         """Fetch org/project/environment context from the API key (once)."""
-        if self._org_id is not None:
+        if self._context_loaded:
             return
         response = self._request("GET", "/sdk/me")
         self._org_id = str(response["organization_id"])
@@ -95,11 +309,13 @@ class Memic:
             self._project_id = str(response["project_id"])
         if response.get("environment_slug"):
             self._env_slug = response["environment_slug"]
+        self._context_loaded = True
 
     @property
     def org_id(self) -> str:
-        """Get organization ID (fetched from API key on first access)."""
-        self._ensure_context()
+        """Get organization ID (passed in, or fetched from API key on first access)."""
+        if self._org_id is None:
+            self._ensure_context()
         assert self._org_id is not None
         return self._org_id
 
@@ -121,6 +337,7 @@ class Memic:
         path: str,
         json: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Make an HTTP request to the API.
 
@@ -129,6 +346,7 @@ class Memic:
             path: API path (will be prefixed with base_url).
             json: JSON body for POST/PUT requests.
             params: Query parameters.
+            timeout: Per-call timeout override in seconds (default: client timeout).
 
         Returns:
             Parsed JSON response.
@@ -138,18 +356,22 @@ class Memic:
             NotFoundError: For 404 responses.
             APIError: For other error responses.
         """
-        url = f"{self.base_url}{path}"
+        return self._request_url(method, self.base_url + path, json, params, timeout)
 
-        try:
-            response = self._session.request(
-                method=method,
-                url=url,
-                json=json,
-                params=params,
-                timeout=self.timeout,
-            )
-        except requests.RequestException as e:
-            raise APIError(f"Request failed: {e}")
+    def _request_url(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Like ``_request`` but with a prebuilt absolute URL.
+
+        Polling loops build their URL once and call this directly instead of
+        formatting the same path on every iteration.
+        """
+        response = self._send(method, url, json, params, timeout or self.timeout)
 
         if response.status_code == 401 or response.status_code == 403:
             raise AuthenticationError(self._get_error_message(response))
@@ -165,22 +387,66 @@ class Memic:
         if response.status_code == 204:
             return {}
 
-        result: Dict[str, Any] = response.json()
+        result: Dict[str, Any] = json_loads(response.content)
         return result
 
-    def _get_error_message(self, response: requests.Response) -> str:
-        """Extract error message from response."""
+    def _send_requests(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+    ) -> requests.Response:
+        """Send an API request through the pooled requests session."""
         try:
-            data: Dict[str, Any] = response.json()
-            detail = data.get("detail")
-            if detail is not None:
-                return str(detail)
-            message = data.get("message")
-            if message is not None:
-                return str(message)
-            return response.text or f"HTTP {response.status_code}"
-        except Exception:
-            return response.text or f"HTTP {response.status_code}"
+            return self._session.request(
+                method=method,
+                url=url,
+                json=json,
+                params=params,
+                timeout=timeout,
+            )
+        except requests.RequestException as e:
+            raise APIError(f"Request failed: {e}")
+
+    def _send_httpx(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+    ) -> "httpx.Response":
+        """Send an API request through the HTTP/2 httpx client.
+
+        httpx's transport only retries connect errors, so transient statuses
+        are retried here with the same policy the requests adapter applies.
+        """
+        assert self._httpx_client is not None
+        retry_statuses = _POST_RETRY_STATUSES if method == "POST" else _RETRY_STATUSES
+        attempt = 0
+        while True:
+            try:
+                response = self._httpx_client.request(
+                    method,
+                    url,
+                    json=json,
+                    params=params,
+                    timeout=timeout,
+                )
+            except self._httpx_error as e:
+                raise APIError(f"Request failed: {e}")
+            if response.status_code not in retry_statuses or attempt >= self.DEFAULT_MAX_RETRIES:
+                return response
+            response.close()
+            if attempt:
+                time.sleep(self.RETRY_BACKOFF_FACTOR * (2 ** attempt))
+            attempt += 1
+
+    def _get_error_message(self, response: Union[requests.Response, "httpx.Response"]) -> str:
+        """Extract error message from response."""
+        return _error_message(response.text, response.status_code)
 
     def list_projects(self) -> List[Project]:
         """List all projects in the organization.
@@ -195,18 +461,21 @@ class Memic:
         """
         response = self._request("GET", "/sdk/projects")
         if isinstance(response, list):
-            return [Project(**p) for p in response]
+            return [Project.model_validate(p) for p in response]
         return []
 
     def upload_file(
         self,
-        file_path: Union[str, Path],
+        file_path: UploadSource,
         wait_for_ready: bool = True,
         reference_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
         poll_interval: float = DEFAULT_POLL_INTERVAL,
         poll_timeout: float = DEFAULT_POLL_TIMEOUT,
         project_id: Optional[str] = None,  # Deprecated — ignored
+        progress_callback: Optional[ProgressCallback] = None,
+        filename: Optional[str] = None,
+        mime_type: Optional[str] = None,
     ) -> File:
         """Upload a file to a project.
 
@@ -219,19 +488,29 @@ class Memic:
         your API key — no IDs needed.
 
         Args:
-            file_path: Path to the file to upload.
+            file_path: Path to the file to upload, or the content itself as
+                ``bytes`` or a seekable binary file object (read from its current
+                position), which avoids writing a temp file first. Non-seekable
+                streams (pipes, sockets, HTTP bodies) must be read into bytes.
             wait_for_ready: If True, poll until file is READY (default: True).
             reference_id: Optional reference ID for external system linking.
             metadata: Optional metadata key-value pairs.
             poll_interval: Seconds between status polls (default: 2.0).
             poll_timeout: Max seconds to wait for READY status (default: 300).
             project_id: Deprecated — ignored, project is resolved from API key.
+            progress_callback: Optional ``callback(bytes_sent, total_bytes)``
+                invoked as each chunk is streamed to storage.
+            filename: Name to upload under. Defaults to the path's name or the
+                file object's ``name``; required for ``bytes``.
+            mime_type: Content type. Defaults to a guess from the filename.
 
         Returns:
             File object with current status.
 
         Raises:
             FileNotFoundError: If file_path doesn't exist.
+            ValueError: If no filename can be determined for bytes/file objects,
+                or a file object is not seekable.
             MemicError: If file processing fails.
 
         Example:
@@ -240,42 +519,30 @@ class Memic:
             ...     reference_id="lesson_123"
             ... )
             >>> print(f"Uploaded: {file.id}, status: {file.status}")
+            >>>
+            >>> # Upload in-memory content without a temp file
+            >>> file = client.upload_file(pdf_bytes, filename="report.pdf")
         """
-        file_path = Path(file_path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        # Get file info
-        file_size = file_path.stat().st_size
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        mime_type = mime_type or "application/octet-stream"
-
-        # Step 1: Initialize upload
-        init_payload: Dict[str, Any] = {
-            "filename": file_path.name,
-            "size": file_size,
-            "mime_type": mime_type,
-        }
-        if reference_id:
-            init_payload["reference_id"] = reference_id
-        if metadata:
-            init_payload["metadata"] = metadata
-
-        init_response = self._request(
-            "POST",
-            "/sdk/files/init",
-            json=init_payload,
-        )
+        with _open_upload_source(
+            file_path, filename, mime_type, self.UPLOAD_READ_BUFFER
+        ) as source:
+            # Step 1: Initialize upload
+            init_response = self._request(
+                "POST",
+                "/sdk/files/init",
+                json=_build_init_payload(source, reference_id, metadata),
+            )
 
-        file_id = init_response["file_id"]
-        upload_url = init_response["upload_url"]
+            file_id = init_response["file_id"]
+            upload_url = init_response["upload_url"]
 
-        # Step 2: PUT file to presigned URL
-        with open(file_path, "rb") as f:
-            put_response = requests.put(
+            # Step 2: PUT file to presigned URL
+            put_response = self._upload_session.put(
                 upload_url,
-                data=f,
-                headers={"Content-Type": mime_type},
+                data=_UploadBody(
+                    source.fileobj, source.size, self.UPLOAD_CHUNK_SIZE, progress_callback
+                ),
+                headers={"Content-Type": source.mime_type},
                 timeout=self.timeout * 10,  # Longer timeout for uploads
             )
             if put_response.status_code >= 400:
@@ -290,7 +557,7 @@ class Memic:
             f"/sdk/files/{file_id}/confirm",
         )
 
-        file = File(**self._normalize_file_response(confirm_response))
+        file = File.model_validate(confirm_response)
 
         # Wait for ready if requested
         if wait_for_ready:
@@ -302,12 +569,130 @@ class Memic:
 
         return file
 
-    def get_file_status(self, file_id: str, project_id: Optional[str] = None) -> File:
+    @overload
+    def upload_files(
+        self,
+        file_paths: Sequence[Union[str, Path]],
+        wait_for_ready: bool = ...,
+        metadata: Optional[Dict[str, Any]] = ...,
+        poll_interval: float = ...,
+        poll_timeout: float = ...,
+        max_concurrency: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> List[File]: ...
+
+    @overload
+    def upload_files(
+        self,
+        file_paths: Sequence[Union[str, Path]],
+        wait_for_ready: bool = ...,
+        metadata: Optional[Dict[str, Any]] = ...,
+        poll_interval: float = ...,
+        poll_timeout: float = ...,
+        max_concurrency: int = ...,
+        *,
+        return_exceptions: Literal[True],
+    ) -> List[Union[File, Exception]]: ...
+
+    def upload_files(
+        self,
+        file_paths: Sequence[Union[str, Path]],
+        wait_for_ready: bool = True,
+        metadata: Optional[Dict[str, Any]] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        poll_timeout: float = DEFAULT_POLL_TIMEOUT,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> Union[List[File], List[Union[File, Exception]]]:
+        """Upload several files concurrently.
+
+        Each file goes through :meth:`upload_file` on a bounded thread pool;
+        connections are reused from the client's pooled sessions. Processing
+        is then tracked for the whole batch with :meth:`get_files_status`.
+
+        Args:
+            file_paths: Paths of the files to upload.
+            wait_for_ready: If True, poll until each file is READY (default: True).
+            metadata: Optional metadata key-value pairs applied to every file.
+            poll_interval: Initial seconds between batch status polls (default: 2.0).
+            poll_timeout: Max seconds to wait for READY status (default: 300).
+            max_concurrency: Max uploads in flight at once (default: 8). Capped at
+                ``UPLOAD_POOL_MAXSIZE`` (32) so every worker keeps a pooled
+                connection instead of re-handshaking.
+            return_exceptions: If True, failed uploads yield their exception in
+                the result list instead of raising.
+
+        Returns:
+            File objects in the same order as ``file_paths``.
+
+        Raises:
+            FileNotFoundError: If a path doesn't exist (unless return_exceptions).
+            MemicError: If an upload or its processing fails (unless return_exceptions).
+
+        Example:
+            >>> files = client.upload_files(["a.pdf", "b.pdf"], max_concurrency=4)
+        """
+        results: List[Union[File, Exception]] = []
+        workers = min(max_concurrency, self.UPLOAD_POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self.upload_file,
+                    file_path,
+                    wait_for_ready=False,
+                    metadata=metadata,
+                )
+                for file_path in file_paths
+            ]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    if not return_exceptions:
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+                    results.append(e)
+
+        if not wait_for_ready:
+            return results
+
+        # Track processing for the whole batch with one status call per poll
+        uploaded = [r.id for r in results if isinstance(r, File)]
+        final = self._wait_for_files(
+            uploaded,
+            poll_interval=poll_interval,
+            poll_timeout=poll_timeout,
+            max_poll_interval=self.DEFAULT_MAX_POLL_INTERVAL,
+            fail_fast=not return_exceptions,
+        )
+        if not return_exceptions:
+            for file in final.values():
+                if file.status.is_failed:
+                    raise _processing_error(file.status, file.error_message)
+        for i, result in enumerate(results):
+            if isinstance(result, File):
+                file = final[result.id]
+                if file.status.is_failed:
+                    results[i] = _processing_error(file.status, file.error_message)
+                else:
+                    results[i] = file
+        return results
+
+    def get_file_status(
+        self,
+        file_id: str,
+        project_id: Optional[str] = None,
+        wait_seconds: Optional[int] = None,
+    ) -> File:
         """Get the current status of a file.
 
         Args:
             file_id: File ID to check.
             project_id: Deprecated — ignored, project is resolved from API key.
+            wait_seconds: If set, ask the server to hold the request (long-poll)
+                for up to this many seconds until the status changes. Servers
+                without long-poll support answer immediately.
 
         Returns:
             File object with current status.
@@ -316,11 +701,34 @@ class Memic:
             >>> file = client.get_file_status(file_id)
             >>> print(f"Status: {file.status}, is_processing: {file.status.is_processing}")
         """
-        response = self._request(
+        return File.model_validate(self._request_file_status(file_id, wait_seconds))
+
+    def _status_url(self, file_id: str) -> str:
+        """Absolute URL of a file's status endpoint."""
+        return "%s/sdk/files/%s/status" % (self.base_url, file_id)
+
+    def _request_file_status(
+        self,
+        file_id: str,
+        wait_seconds: Optional[int] = None,
+        url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Fetch the raw status payload for a file (see ``get_file_status``).
+
+        ``url`` lets polling loops pass a status URL they built once up front.
+        """
+        params = None
+        timeout = None
+        if wait_seconds is not None:
+            params = {"wait": wait_seconds}
+            # Extend the configured timeout to cover the hold, never shorten it
+            timeout = max(self.timeout, wait_seconds + self.LONG_POLL_GRACE)
+        return self._request_url(
             "GET",
-            f"/sdk/files/{file_id}/status",
+            url or self._status_url(file_id),
+            params=params,
+            timeout=timeout,
         )
-        return File(**self._normalize_file_response(response))
 
     def wait_for_ready(
         self,
@@ -328,14 +736,22 @@ class Memic:
         poll_interval: float = DEFAULT_POLL_INTERVAL,
         poll_timeout: float = DEFAULT_POLL_TIMEOUT,
         project_id: Optional[str] = None,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
     ) -> File:
         """Wait for a file to reach READY status.
 
+        Each status check is a long-poll (see ``get_file_status``); between
+        checks the client backs off exponentially while the status is
+        unchanged and resets to ``poll_interval`` whenever processing moves
+        to a new stage. Time the server spent holding a long-poll counts
+        toward the next delay.
+
         Args:
             file_id: File ID to wait for.
-            poll_interval: Seconds between status checks (default: 2.0).
+            poll_interval: Initial seconds between status checks (default: 2.0).
             poll_timeout: Max seconds to wait (default: 300).
             project_id: Deprecated — ignored, project is resolved from API key.
+            max_poll_interval: Upper bound on the backed-off interval (default: 15.0).
 
         Returns:
             File object with READY status.
@@ -344,27 +760,184 @@ class Memic:
             MemicError: If file processing fails or timeout is reached.
         """
         start_time = time.time()
+        attempt = 0
+        last_status: Optional[FileStatus] = None
+        status_url = self._status_url(file_id)
 
         while True:
-            file = self.get_file_status(file_id)
+            poll_started = time.time()
+            remaining = poll_timeout - (poll_started - start_time)
+            response = self._request_file_status(
+                file_id,
+                wait_seconds=self._long_poll_wait(remaining),
+                url=status_url,
+            )
 
-            if file.status == FileStatus.READY:
-                return file
+            # Only the status is inspected while polling; the full File model
+            # is validated once, when the file is ready.
+            status = FileStatus(response.get("status", FileStatus.UPLOADING.value))
+            if status is FileStatus.READY:
+                return File.model_validate(response)
 
-            if file.status.is_failed:
+            if status.is_failed:
+                raise _processing_error(status, response.get("error_message"))
+
+            elapsed = time.time() - start_time
+            if elapsed >= poll_timeout:
                 raise MemicError(
-                    f"File processing failed with status {file.status.value}: "
-                    f"{file.error_message or 'Unknown error'}"
+                    f"Timeout waiting for file to be ready. "
+                    f"Current status: {status.value}"
+                )
+
+            if status != last_status:
+                attempt = 0
+                last_status = status
+
+            delay = min(max_poll_interval, poll_interval * (self.POLL_BACKOFF_FACTOR ** attempt))
+            delay += random.uniform(0, 0.25)
+            delay -= time.time() - poll_started
+            if delay > 0:
+                time.sleep(min(delay, poll_timeout - elapsed))
+            attempt += 1
+
+    def _long_poll_wait(self, remaining: float) -> int:
+        """Pick a long-poll hold time that fits in ``remaining`` seconds.
+
+        A read timeout on the status GET is retried by the transport up to
+        ``DEFAULT_MAX_RETRIES`` times, each attempt allowed ``max(timeout,
+        wait + LONG_POLL_GRACE)`` seconds. The wait is sized for every
+        attempt rather than just the first, so the hold itself never stretches
+        a retried read past ``remaining``; only the configured ``timeout`` can.
+        """
+        attempts = self.DEFAULT_MAX_RETRIES + 1
+        per_attempt = remaining / attempts - self.LONG_POLL_GRACE
+        return max(1, int(min(self.LONG_POLL_WAIT, per_attempt)))
+
+    def get_files_status(self, file_ids: Sequence[str]) -> Dict[str, File]:
+        """Get the current status of several files in one call.
+
+        Uses the bulk ``POST /sdk/files/status:batch`` endpoint. If the server
+        doesn't expose it (404/405), falls back to concurrent per-file
+        requests and skips the bulk endpoint for the rest of the client's life.
+
+        Args:
+            file_ids: File IDs to check.
+
+        Returns:
+            Mapping of file ID to File object.
+
+        Example:
+            >>> statuses = client.get_files_status([f.id for f in files])
+            >>> pending = [fid for fid, f in statuses.items() if f.status.is_processing]
+        """
+        if not file_ids:
+            return {}
+
+        if self._batch_status_supported:
+            try:
+                response = self._request(
+                    "POST",
+                    "/sdk/files/status:batch",
+                    json={"file_ids": list(file_ids)},
                 )
+            except NotFoundError:
+                self._batch_status_supported = False
+            except APIError as e:
+                if e.status_code != 405:
+                    raise
+                self._batch_status_supported = False
+            else:
+                files = [File.model_validate(r) for r in response.get("items", [])]
+                return {file.id: file for file in files}
+
+        max_workers = min(self.DEFAULT_MAX_CONCURRENCY, len(file_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            files = list(executor.map(self.get_file_status, file_ids))
+        return {file.id: file for file in files}
+
+    def wait_for_all_ready(
+        self,
+        file_ids: Sequence[str],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        poll_timeout: float = DEFAULT_POLL_TIMEOUT,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> List[File]:
+        """Wait for several files to reach READY status.
+
+        Polls :meth:`get_files_status` once per interval for the whole batch,
+        with the same backoff schedule as :meth:`wait_for_ready`.
+
+        Args:
+            file_ids: File IDs to wait for.
+            poll_interval: Initial seconds between status checks (default: 2.0).
+            poll_timeout: Max seconds to wait (default: 300).
+            max_poll_interval: Upper bound on the backed-off interval (default: 15.0).
+
+        Returns:
+            File objects with READY status, in the same order as ``file_ids``.
+
+        Raises:
+            MemicError: If any file's processing fails or timeout is reached.
+        """
+        final = self._wait_for_files(
+            file_ids,
+            poll_interval=poll_interval,
+            poll_timeout=poll_timeout,
+            max_poll_interval=max_poll_interval,
+            fail_fast=True,
+        )
+        for file in final.values():
+            if file.status.is_failed:
+                raise _processing_error(file.status, file.error_message)
+        return [final[file_id] for file_id in file_ids]
+
+    def _wait_for_files(
+        self,
+        file_ids: Sequence[str],
+        poll_interval: float,
+        poll_timeout: float,
+        max_poll_interval: float,
+        fail_fast: bool,
+    ) -> Dict[str, File]:
+        """Poll batch status until every file is READY or failed.
+
+        With ``fail_fast``, returns as soon as any file has failed.
+        """
+        start_time = time.time()
+        attempt = 0
+        last_statuses: Dict[str, FileStatus] = {}
+        final: Dict[str, File] = {}
+        pending = list(file_ids)
+
+        while pending:
+            batch = self.get_files_status(pending)
+            for file_id, file in batch.items():
+                if not file.status.is_processing:
+                    final[file_id] = file
+                    if fail_fast and file.status.is_failed:
+                        return final
+            pending = [file_id for file_id in pending if file_id not in final]
+            if not pending:
+                break
 
             elapsed = time.time() - start_time
             if elapsed >= poll_timeout:
                 raise MemicError(
-                    f"Timeout waiting for file to be ready. "
-                    f"Current status: {file.status.value}"
+                    f"Timeout waiting for files to be ready. "
+                    f"Still processing: {', '.join(pending)}"
                 )
 
-            time.sleep(poll_interval)
+            statuses = {file_id: file.status for file_id, file in batch.items()}
+            if statuses != last_statuses:
+                attempt = 0
+                last_statuses = statuses
+
+            delay = min(max_poll_interval, poll_interval * (self.POLL_BACKOFF_FACTOR ** attempt))
+            delay += random.uniform(0, 0.25)
+            time.sleep(min(delay, poll_timeout - elapsed))
+            attempt += 1
+
+        return final
 
     def search(
         self,
@@ -419,85 +992,166 @@ class Memic:
             json=payload,
         )
 
-        # Parse nested results structure
-        results_data = response.get("results", {})
-
-        # Parse semantic/document results
-        semantic_results = [
-            SearchResult(
-                chunk_id=str(r.get("chunk_id", "")),
-                file_id=str(r.get("file_id", "")),
-                file_name=r.get("file_name", ""),
-                content=r.get("content", ""),
-                score=r.get("score", 0.0),
-                chunk_index=r.get("chunk_index", 0),
-                page_number=r.get("page_number"),
-                start_page=r.get("start_page"),
-                end_page=r.get("end_page"),
-                project_id=str(r.get("project_id")) if r.get("project_id") else None,
-                reference_id=r.get("reference_id"),
-                category=r.get("category"),
-                document_type=r.get("document_type"),
-                bounding_boxes=r.get("bounding_boxes"),
-            )
-            for r in results_data.get("semantic", [])
-        ]
-
-        # Parse structured/database results with column metadata
-        structured_result = None
-        structured_data = results_data.get("structured")
-        if structured_data:
-            columns = [
-                ColumnInfo(
-                    name=c.get("name", ""),
-                    type=c.get("type", "unknown"),
-                    description=c.get("description"),
-                )
-                for c in structured_data.get("columns", [])
-            ]
-            structured_result = StructuredResult(
-                columns=columns,
-                rows=structured_data.get("rows", []),
-            )
+        return _parse_search_response(response, query)
 
-        # Parse routing information
-        routing = None
-        if response.get("routing"):
-            routing_data = response["routing"]
-            routing = SearchRouting(
-                route=routing_data.get("route", "semantic"),
-                reasoning=routing_data.get("reasoning"),
-                connector_id=routing_data.get("connector_id"),
-                connector_name=routing_data.get("connector_name"),
-                sql_generated=routing_data.get("sql_generated"),
-                sql_explanation=routing_data.get("sql_explanation"),
-            )
 
-        return SearchResults(
-            query=response.get("query", query),
-            results=ResultsContainer(
-                semantic=semantic_results,
-                structured=structured_result,
-            ),
-            routing=routing,
-            total_results=response.get("total_results", len(semantic_results)),
-            search_time_ms=response.get("search_time_ms", 0.0),
+def _error_message(text: str, status_code: int) -> str:
+    """Extract an error message from an API error response body."""
+    try:
+        data: Dict[str, Any] = json_loads(text)
+        detail = data.get("detail")
+        if detail is not None:
+            return str(detail)
+        message = data.get("message")
+        if message is not None:
+            return str(message)
+        return text or f"HTTP {status_code}"
+    except Exception:
+        return text or f"HTTP {status_code}"
+
+
+@functools.lru_cache(maxsize=256)
+def _mime_for_suffix(suffix: str) -> str:
+    """Guess a MIME type from a file extension, caching per extension."""
+    mime_type, _ = mimetypes.guess_type("x" + suffix)
+    return mime_type or "application/octet-stream"
+
+
+class _UploadSource(NamedTuple):
+    """An open upload body and the details the init request needs."""
+
+    fileobj: BinaryIO
+    filename: str
+    size: int
+    mime_type: str
+
+
+@contextlib.contextmanager
+def _open_upload_source(
+    source: UploadSource,
+    filename: Optional[str],
+    mime_type: Optional[str],
+    buffering: int,
+) -> Iterator[_UploadSource]:
+    """Open a path, bytes or binary file object for upload.
+
+    Paths are opened (and closed) here; bytes and caller-owned file objects
+    are read in place from their current position, with no temp file.
+    """
+    owned: Optional[BinaryIO] = None
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        size = len(source) if not isinstance(source, memoryview) else source.nbytes
+        fileobj: BinaryIO = io.BytesIO(source)
+        name = filename
+    elif isinstance(source, (str, os.PathLike)):
+        path = Path(source)
+        # A single stat both checks existence and gives the size
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
+        fileobj = owned = open(path, "rb", buffering=buffering)
+        name = filename or path.name
+    else:
+        fileobj = source
+        size = _remaining_size(fileobj)
+        # TemporaryFile() and open(fd) carry an integer fd as their name
+        raw_name = getattr(fileobj, "name", None)
+        if isinstance(raw_name, (str, os.PathLike)):
+            name = filename or os.path.basename(os.fspath(raw_name))
+        else:
+            name = filename
+
+    if not name:
+        if owned is not None:
+            owned.close()
+        raise ValueError("filename is required when uploading bytes or an unnamed file object")
+
+    try:
+        yield _UploadSource(
+            fileobj=fileobj,
+            filename=name,
+            size=size,
+            mime_type=mime_type or _mime_for_suffix(Path(name).suffix.lower()),
         )
+    finally:
+        if owned is not None:
+            owned.close()
 
-    def _normalize_file_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize file response fields to match File model."""
-        return {
-            "id": str(response.get("id", "")),
-            "name": response.get("name", ""),
-            "original_filename": response.get("original_filename", ""),
-            "size": response.get("size", 0),
-            "mime_type": response.get("mime_type", ""),
-            "project_id": str(response.get("project_id", "")),
-            "status": response.get("status", "uploading"),
-            "reference_id": response.get("reference_id"),
-            "error_message": response.get("error_message"),
-            "total_chunks": response.get("total_chunks", 0),
-            "total_embeddings": response.get("total_embeddings", 0),
-            "created_at": response.get("created_at"),
-            "updated_at": response.get("updated_at"),
-        }
+
+def _remaining_size(fileobj: BinaryIO) -> int:
+    """Bytes left from the current position, leaving the position unchanged.
+
+    The init request needs the size up front, so the stream must be seekable.
+    """
+    try:
+        if fileobj.seekable():
+            start = fileobj.tell()
+            size = fileobj.seek(0, io.SEEK_END) - start
+            fileobj.seek(start)
+            return size
+    except (AttributeError, OSError):
+        pass
+    raise ValueError(
+        "upload_file needs a seekable file object to determine the upload size; "
+        "read pipes, sockets and HTTP bodies into bytes first"
+    )
+
+
+def _build_init_payload(
+    source: _UploadSource,
+    reference_id: Optional[str],
+    metadata: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Describe an upload for the /sdk/files/init request."""
+    payload: Dict[str, Any] = {
+        "filename": source.filename,
+        "size": source.size,
+        "mime_type": source.mime_type,
+    }
+    if reference_id:
+        payload["reference_id"] = reference_id
+    if metadata:
+        payload["metadata"] = metadata
+    return payload
+
+
+def _processing_error(status: FileStatus, error_message: Optional[str]) -> MemicError:
+    """Build the error raised when a file's processing has failed."""
+    return MemicError(
+        f"File processing failed with status {status.value}: "
+        f"{error_message or 'Unknown error'}"
+    )
+
+
+def _parse_search_response(response: Dict[str, Any], query: str) -> SearchResults:
+    """Build SearchResults from a /sdk/search response body."""
+    # Parse nested results structure
+    results_data = response.get("results", {})
+
+    # Parse semantic/document results
+    semantic_results = [
+        SearchResult.model_validate(r) for r in results_data.get("semantic", [])
+    ]
+
+    # Parse structured/database results with column metadata
+    structured_result = None
+    structured_data = results_data.get("structured")
+    if structured_data:
+        structured_result = StructuredResult.model_validate(structured_data)
+
+    # Parse routing information
+    routing = None
+    if response.get("routing"):
+        routing = SearchRouting.model_validate(response["routing"])
+
+    return SearchResults(
+        query=response.get("query", query),
+        results=ResultsContainer(
+            semantic=semantic_results,
+            structured=structured_result,
+        ),
+        routing=routing,
+        total_results=response.get("total_results", len(semantic_results)),
+        search_time_ms=response.get("search_time_ms", 0.0),
+    )
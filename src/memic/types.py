@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Iterator, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class FileStatus(str, Enum):
@@ -30,12 +30,15 @@ class FileStatus(str, Enum):
     @property
     def is_failed(self) -> bool:
         """Check if status indicates a failure."""
-        return self.value.endswith("_failed")
+        return self in _FAILED_STATUSES
 
     @property
     def is_processing(self) -> bool:
         """Check if file is still being processed."""
-        return not self.is_failed and self != FileStatus.READY
+        return self is not FileStatus.READY and self not in _FAILED_STATUSES
+
+
+_FAILED_STATUSES = frozenset(s for s in FileStatus if s.value.endswith("_failed"))
 
 
 class Project(BaseModel):
@@ -53,12 +56,12 @@ class File(BaseModel):
     """File information returned from the API."""
 
     id: str
-    name: str
-    original_filename: str
-    size: int
-    mime_type: str
-    project_id: str
-    status: FileStatus
+    name: str = ""
+    original_filename: str = ""
+    size: int = 0
+    mime_type: str = ""
+    project_id: str = ""
+    status: FileStatus = FileStatus.UPLOADING
     reference_id: Optional[str] = None
     error_message: Optional[str] = None
     total_chunks: int = 0
@@ -66,6 +69,12 @@ class File(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    @field_validator("id", "project_id", mode="before")
+    @classmethod
+    def _coerce_id(cls, value: Any) -> Any:
+        """Accept UUIDs/integers for ID fields."""
+        return str(value)
+
 
 class PageRange(BaseModel):
     """Page range filter for search."""
@@ -129,8 +138,8 @@ class MetadataFilters(BaseModel):
 class ColumnInfo(BaseModel):
     """Column metadata for structured results."""
 
-    name: str = Field(description="Column name")
-    type: str = Field(description="Column data type (e.g., varchar, integer)")
+    name: str = Field("", description="Column name")
+    type: str = Field("unknown", description="Column data type (e.g., varchar, integer)")
     description: Optional[str] = Field(None, description="Human-readable column description")
 
 
@@ -138,7 +147,9 @@ class StructuredResult(BaseModel):
     """Structured query results with schema metadata."""
 
     columns: List[ColumnInfo] = Field(default_factory=list, description="Column metadata")
-    rows: List[Dict[str, Any]] = Field(default_factory=list, description="Result rows as key-value objects")
+    rows: List[Dict[str, Any]] = Field(
+        default_factory=list, description="Result rows as key-value objects"
+    )
 
     def __len__(self) -> int:
         """Return number of rows."""
@@ -157,22 +168,26 @@ class StructuredResult(BaseModel):
 class SearchRouting(BaseModel):
     """Routing information for hybrid search."""
 
-    route: str = Field(description="Route taken: 'semantic', 'structured', or 'hybrid'")
+    route: str = Field(
+        "semantic", description="Route taken: 'semantic', 'structured', or 'hybrid'"
+    )
     reasoning: Optional[str] = Field(None, description="Explanation of routing decision")
     connector_id: Optional[str] = Field(None, description="Database connector ID if structured")
     connector_name: Optional[str] = Field(None, description="Database connector name")
-    sql_generated: Optional[str] = Field(None, description="Generated SQL query for structured search")
+    sql_generated: Optional[str] = Field(
+        None, description="Generated SQL query for structured search"
+    )
     sql_explanation: Optional[str] = Field(None, description="Explanation of the generated SQL")
 
 
 class SearchResult(BaseModel):
     """Individual search result chunk."""
 
-    chunk_id: str
-    file_id: str
-    file_name: str
-    content: str
-    score: float
+    chunk_id: str = ""
+    file_id: str = ""
+    file_name: str = ""
+    content: str = ""
+    score: float = 0.0
     chunk_index: int = 0
     page_number: Optional[int] = None
     start_page: Optional[int] = None
@@ -183,12 +198,28 @@ class SearchResult(BaseModel):
     document_type: Optional[str] = None
     bounding_boxes: Optional[Dict[str, Any]] = None
 
+    @field_validator("chunk_id", "file_id", mode="before")
+    @classmethod
+    def _coerce_id(cls, value: Any) -> Any:
+        """Accept UUIDs/integers for ID fields."""
+        return str(value)
+
+    @field_validator("project_id", mode="before")
+    @classmethod
+    def _coerce_optional_id(cls, value: Any) -> Any:
+        """Accept UUIDs/integers, treating empty values as missing."""
+        return str(value) if value else None
+
 
 class ResultsContainer(BaseModel):
     """Container for all result types (semantic and structured)."""
 
-    semantic: List[SearchResult] = Field(default_factory=list, description="Semantic search results")
-    structured: Optional[StructuredResult] = Field(None, description="Structured query results with schema")
+    semantic: List[SearchResult] = Field(
+        default_factory=list, description="Semantic search results"
+    )
+    structured: Optional[StructuredResult] = Field(
+        None, description="Structured query results with schema"
+    )
 
 
 class SearchResults(BaseModel):
@@ -0,0 +1,35 @@
+"""Shared pytest fixtures."""
+
+from typing import Iterator, List
+
+import pytest
+import requests_mock
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "serial: talks to a shared backend; never run concurrently with itself"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """Pin serial tests to one pytest-xdist worker (with ``--dist loadgroup``).
+
+    Runs before xdist's own hook, which reads ``xdist_group`` markers to
+    build the ``@group`` node IDs the scheduler distributes by.
+    """
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("backend"))
+
+
+@pytest.fixture
+def mock_transport() -> Iterator[requests_mock.Mocker]:
+    """Mock HTTP at the requests transport layer.
+
+    Routes are registered with ``mock_transport.get(url, json=...)`` and
+    friends; anything unregistered raises instead of reaching the network.
+    """
+    with requests_mock.Mocker(real_http=False) as mock:
+        yield mock
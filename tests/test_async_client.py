@@ -0,0 +1,195 @@
+"""Unit tests for the async Memic client."""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from memic import (  # noqa: E402
+    APIError,
+    AsyncMemic,
+    AuthenticationError,
+    FileStatus,
+    MemicError,
+    NotFoundError,
+    SearchResults,
+)
+
+
+def _file_body(file_id: str, status: str) -> Dict[str, Any]:
+    return {
+        "id": file_id,
+        "name": "test.pdf",
+        "original_filename": "test.pdf",
+        "size": 12,
+        "mime_type": "application/pdf",
+        "project_id": "proj-789-abc",
+        "status": status,
+    }
+
+
+def _run_with_server(
+    routes: List[web.RouteDef],
+    scenario: Callable[[AsyncMemic, str], Awaitable[Any]],
+) -> Any:
+    """Serve routes on a local aiohttp server and run scenario against it."""
+
+    async def main() -> Any:
+        app = web.Application()
+        app.add_routes(routes)
+        server = TestServer(app)
+        await server.start_server()
+        base_url = str(server.make_url("")).rstrip("/")
+        try:
+            async with AsyncMemic(api_key="mk_test_key_123", base_url=base_url) as client:
+                return await scenario(client, base_url)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+class TestAsyncClientInit:
+    """Tests for async client initialization."""
+
+    def test_init_with_api_key(self) -> None:
+        """Client initializes without a running event loop."""
+        client = AsyncMemic(api_key="mk_test_key_123", base_url="https://api.com/")
+        assert client.api_key == "mk_test_key_123"
+        assert client.base_url == "https://api.com"
+        assert client._session is None
+
+    def test_init_without_api_key_raises(self) -> None:
+        """Client raises AuthenticationError without API key."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(AuthenticationError, match="No API key provided"):
+                AsyncMemic()
+
+
+class TestAsyncRequests:
+    """Tests for async API calls against a local server."""
+
+    def test_list_projects(self) -> None:
+        """list_projects sends the API key and returns Project objects."""
+        seen_keys: List[str] = []
+
+        async def projects(request: web.Request) -> web.Response:
+            seen_keys.append(request.headers.get("X-API-Key", ""))
+            return web.json_response(
+                [{"id": "proj-1", "name": "Project 1", "organization_id": "org-1"}]
+            )
+
+        projects_list = _run_with_server(
+            [web.get("/sdk/projects", projects)],
+            lambda client, _: client.list_projects(),
+        )
+
+        assert seen_keys == ["mk_test_key_123"]
+        assert projects_list[0].id == "proj-1"
+
+    def test_concurrent_searches(self) -> None:
+        """Concurrent searches share one session and parse results."""
+
+        async def search(request: web.Request) -> web.Response:
+            body = await request.json()
+            return web.json_response(
+                {
+                    "query": body["query"],
+                    "results": {
+                        "semantic": [
+                            {
+                                "chunk_id": "c1",
+                                "file_id": "f1",
+                                "file_name": "a.pdf",
+                                "content": body["query"],
+                                "score": 0.9,
+                            }
+                        ]
+                    },
+                    "total_results": 1,
+                }
+            )
+
+        async def scenario(client: AsyncMemic, _: str) -> List[SearchResults]:
+            return list(
+                await asyncio.gather(*(client.search(query=f"q{i}") for i in range(5)))
+            )
+
+        results = _run_with_server([web.post("/sdk/search", search)], scenario)
+
+        assert [r[0].content for r in results] == [f"q{i}" for i in range(5)]
+
+    def test_upload_file(self, tmp_path: Path) -> None:
+        """upload_file streams the file to storage without the API key."""
+        put: Dict[str, Any] = {}
+
+        async def init(request: web.Request) -> web.Response:
+            return web.json_response(
+                {"file_id": "file-1", "upload_url": f"{request.url.origin()}/storage"},
+                status=201,
+            )
+
+        async def storage(request: web.Request) -> web.Response:
+            put["headers"] = dict(request.headers)
+            put["body"] = await request.read()
+            return web.Response(status=200)
+
+        async def confirm(request: web.Request) -> web.Response:
+            return web.json_response(_file_body("file-1", "ready"))
+
+        temp_path = tmp_path / "test.pdf"
+        temp_path.write_bytes(b"test content")
+
+        file = _run_with_server(
+            [
+                web.post("/sdk/files/init", init),
+                web.put("/storage", storage),
+                web.post("/sdk/files/file-1/confirm", confirm),
+            ],
+            lambda client, _: client.upload_file(temp_path, wait_for_ready=False),
+        )
+
+        assert file.id == "file-1"
+        assert file.status == FileStatus.READY
+        assert put["body"] == b"test content"
+        assert put["headers"]["Content-Length"] == "12"
+        assert "X-API-Key" not in put["headers"]
+
+    def test_wait_for_ready_failed(self) -> None:
+        """wait_for_ready raises MemicError on a failed status."""
+
+        async def status(request: web.Request) -> web.Response:
+            return web.json_response(_file_body("file-1", "chunking_failed"))
+
+        with pytest.raises(MemicError, match="chunking_failed"):
+            _run_with_server(
+                [web.get("/sdk/files/file-1/status", status)],
+                lambda client, _: client.wait_for_ready("file-1"),
+            )
+
+
+class TestAsyncExceptionHandling:
+    """Tests for async exception mapping."""
+
+    @pytest.mark.parametrize(
+        "status,exc",
+        [(401, AuthenticationError), (404, NotFoundError), (500, APIError)],
+    )
+    def test_status_maps_to_exception(self, status: int, exc: type) -> None:
+        """Error status codes map to the same exceptions as the sync client."""
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.json_response({"detail": "boom"}, status=status)
+
+        with pytest.raises(exc, match="boom"):
+            _run_with_server(
+                [web.get("/sdk/files/x/status", handler)],
+                lambda client, _: client.get_file_status("x"),
+            )
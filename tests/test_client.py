@@ -1,11 +1,20 @@
 """Unit tests for the Memic client."""
 
+import contextlib
+import io
+import json
 import os
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 from unittest.mock import patch
 
 import pytest
-import responses
+import requests_mock
+import urllib3
 
 from memic import (
     APIError,
@@ -13,42 +22,148 @@ from memic import (
     File,
     FileStatus,
     Memic,
+    MemicError,
     MetadataFilters,
     NotFoundError,
     PageRange,
+    SearchResult,
     SearchResults,
 )
+from memic.client import _ApiRetry, _UploadBody
 
+# Canned API response bodies, read once and served as pre-serialized JSON
+_FIXTURES = Path(__file__).parent / "fixtures"
+_ME_BYTES = (_FIXTURES / "me.json").read_bytes()
+_PROJECTS_BYTES = (_FIXTURES / "projects.json").read_bytes()
+_SEARCH_BASIC_BYTES = (_FIXTURES / "search_basic.json").read_bytes()
+_SEARCH_EMPTY_BYTES = (_FIXTURES / "search_empty.json").read_bytes()
+_SEARCH_TWO_RESULTS_BYTES = (_FIXTURES / "search_two_results.json").read_bytes()
+_SEARCH_STRUCTURED_BYTES = (_FIXTURES / "search_structured.json").read_bytes()
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def api_key() -> str:
     return "mk_test_key_123"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_url() -> str:
     return "https://api.memic.ai"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def org_id() -> str:
     return "org-123-456"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def project_id() -> str:
     return "proj-789-abc"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def file_id() -> str:
     return "file-def-456"
 
 
+@pytest.fixture(scope="module")
+def client(api_key: str, base_url: str) -> Iterator[Memic]:
+    """Share one Memic client per module (context is lazy-fetched, no mock needed at init)."""
+    with Memic(api_key=api_key, base_url=base_url) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def reset_client(client: Memic) -> None:
+    """Clear state the shared client caches from earlier tests' responses."""
+    client._org_id = None
+    client._project_id = None
+    client._env_slug = None
+    client._context_loaded = False
+    client._batch_status_supported = True
+
+
+class _RequestRecorder:
+    """Stand-in for ``Memic._request`` that records calls and returns ``response``."""
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+        self.response: Dict[str, Any] = {}
+
+
+@pytest.fixture
+def mock_request(monkeypatch: pytest.MonkeyPatch) -> _RequestRecorder:
+    """Patch ``Memic._request`` for tests of request building and response parsing.
+
+    Skips the HTTP stack entirely; use ``mock_transport`` where headers,
+    status codes or other HTTP-level behavior are under test.
+    """
+    recorder = _RequestRecorder()
+
+    def fake_request(
+        self: Memic,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        recorder.calls.append((method, path, {"json": json, "params": params}))
+        return recorder.response
+
+    monkeypatch.setattr(Memic, "_request", fake_request)
+    return recorder
+
+
+class _LocalServer:
+    """Real HTTP server on localhost that plays scripted responses per route.
+
+    Unlike ``mock_transport`` it sits behind the real connection adapter, so
+    urllib3's retry policy runs against it.
+    """
+
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], List[Tuple[int, Any]]] = {}
+        self.requests: List[Tuple[str, str]] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self) -> None:
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                server.requests.append((self.command, self.path))
+                script = server.routes.get((self.command, self.path), [(404, {})])
+                status, body = script.pop(0) if len(script) > 1 else script[0]
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = _respond
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
 @pytest.fixture
-def client(api_key: str, base_url: str) -> Memic:
-    """Create a Memic client (context is lazy-fetched, no mock needed at init)."""
-    return Memic(api_key=api_key, base_url=base_url)
+def local_server() -> Iterator[_LocalServer]:
+    """Serve scripted responses from a real localhost HTTP server."""
+    server = _LocalServer()
+    yield server
+    server.close()
 
 
 class TestClientInit:
@@ -84,147 +199,387 @@ class TestClientInit:
         client = Memic(api_key=api_key, base_url="https://api.com/")
         assert client.base_url == "https://api.com"
 
+    def test_init_mounts_pooled_adapter(self, api_key: str) -> None:
+        """Client mounts a pooled, retrying adapter for both schemes."""
+        client = Memic(api_key=api_key)
+        for prefix in ("https://", "http://"):
+            adapter = client._session.get_adapter(prefix + "api.com")
+            assert adapter._pool_maxsize == Memic.DEFAULT_POOL_MAXSIZE  # type: ignore[attr-defined]
+            assert adapter.max_retries.total == Memic.DEFAULT_MAX_RETRIES  # type: ignore[attr-defined]
+
+
+class TestHttpxTransport:
+    """Tests for the optional HTTP/2 httpx backend."""
+
+    def test_unknown_transport_raises(self, api_key: str) -> None:
+        """An unknown transport name is rejected."""
+        with pytest.raises(ValueError, match="Unknown transport"):
+            Memic(api_key=api_key, transport="urllib")  # type: ignore[arg-type]
+
+    def test_httpx_transport_routes_requests(
+        self, api_key: str, base_url: str, org_id: str
+    ) -> None:
+        """API calls go through the httpx client with the API key header."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        seen: List[Any] = []
+
+        def handler(request: Any) -> Any:
+            seen.append(request)
+            if request.url.path == "/sdk/files/missing/status":
+                return httpx.Response(404, json={"detail": "File not found"})
+            return httpx.Response(200, json=[{"id": "p1", "name": "P", "organization_id": org_id}])
+
+        with patch.object(httpx, "HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = Memic(api_key=api_key, base_url=base_url, transport="httpx")
+        with client:
+            projects = client.list_projects()
+            with pytest.raises(NotFoundError, match="File not found"):
+                client.get_file_status("missing")
+
+        assert projects[0].id == "p1"
+        assert seen[0].headers["X-API-Key"] == api_key
+
+    @pytest.mark.parametrize(
+        "method,code,attempts", [("GET", 502, 2), ("POST", 503, 2), ("POST", 500, 1)]
+    )
+    def test_httpx_transport_retries_transient_statuses(
+        self, api_key: str, base_url: str, method: str, code: int, attempts: int
+    ) -> None:
+        """The httpx backend retries 429/5xx like the requests adapter does."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        statuses = iter([code, 200])
+        seen: List[Any] = []
+
+        def handler(request: Any) -> Any:
+            seen.append(request)
+            return httpx.Response(next(statuses), json={"detail": "boom"})
+
+        with patch.object(httpx, "HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = Memic(api_key=api_key, base_url=base_url, transport="httpx")
+        with client, contextlib.suppress(APIError):
+            client._request(method, "/sdk/search")
+
+        assert len(seen) == attempts
+
 
 class TestOrgIdFetch:
     """Tests for org_id auto-discovery."""
 
-    @responses.activate
     def test_org_id_fetched_on_first_access(
-        self, api_key: str, base_url: str, org_id: str
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str, org_id: str
     ) -> None:
         """org_id is fetched from API on first access."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/sdk/me",
-            json={"organization_id": org_id, "organization_name": "Test Org"},
-            status=200,
-        )
+        mock_transport.get(f"{base_url}/sdk/me", content=_ME_BYTES, headers=_JSON_HEADERS)
 
-        client = Memic(api_key=api_key, base_url=base_url)
         assert client._org_id is None  # Not fetched yet
         assert client.org_id == org_id  # Fetched on access
         assert client._org_id == org_id  # Cached
 
-    @responses.activate
-    def test_org_id_cached(self, api_key: str, base_url: str, org_id: str) -> None:
+    def test_org_id_cached(
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str, org_id: str
+    ) -> None:
         """org_id is cached after first fetch."""
-        responses.add(
-            responses.GET,
+        mock_transport.get(
             f"{base_url}/sdk/me",
             json={"organization_id": org_id},
-            status=200,
+            status_code=200,
         )
 
-        client = Memic(api_key=api_key, base_url=base_url)
         _ = client.org_id
         _ = client.org_id  # Second access
 
         # Only one request should be made
-        assert len(responses.calls) == 1
+        assert mock_transport.call_count == 1
+
+    def test_org_id_injected_skips_fetch(self, api_key: str, org_id: str) -> None:
+        """A caller-supplied organization_id needs no /sdk/me request."""
+        with Memic(api_key=api_key, organization_id=org_id) as client:
+            with patch.object(client, "_request") as request:
+                assert client.org_id == org_id
+        request.assert_not_called()
+
+    def test_injected_org_id_still_resolves_project(
+        self,
+        mock_transport: requests_mock.Mocker,
+        api_key: str,
+        base_url: str,
+        org_id: str,
+        project_id: str,
+    ) -> None:
+        """project_id is still fetched from the API key when org is injected."""
+        mock_transport.get(
+            f"{base_url}/sdk/me",
+            json={"organization_id": org_id, "project_id": project_id},
+        )
+
+        with Memic(api_key=api_key, base_url=base_url, organization_id=org_id) as client:
+            assert client.project_id == project_id
+        assert mock_transport.call_count == 1
+
+
+class TestRequestHeaders:
+    """Tests for headers sent on API requests."""
+
+    def test_get_has_no_content_type(
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str
+    ) -> None:
+        """GET requests carry no Content-Type but accept compressed responses."""
+        mock_transport.get(f"{base_url}/sdk/projects", json=[])
+
+        client.list_projects()
+
+        headers = mock_transport.request_history[-1].headers
+        assert "Content-Type" not in headers
+        assert "gzip" in headers["Accept-Encoding"]
+
+    def test_json_post_has_content_type(
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str
+    ) -> None:
+        """JSON bodies are still labelled application/json."""
+        mock_transport.post(
+            f"{base_url}/sdk/search",
+            json={"query": "q", "results": {"semantic": []}},
+        )
+
+        client.search(query="q")
+
+        assert mock_transport.request_history[-1].headers["Content-Type"] == "application/json"
 
 
 class TestListProjects:
     """Tests for list_projects method."""
 
-    @responses.activate
     def test_list_projects_success(
-        self, api_key: str, base_url: str, org_id: str
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str, org_id: str
     ) -> None:
         """list_projects returns list of Project objects."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/sdk/projects",
-            json=[
-                {"id": "proj-1", "name": "Project 1", "organization_id": org_id, "is_active": True},
-                {"id": "proj-2", "name": "Project 2", "organization_id": org_id, "is_active": True},
-            ],
-            status=200,
+        mock_transport.get(
+            f"{base_url}/sdk/projects", content=_PROJECTS_BYTES, headers=_JSON_HEADERS
         )
 
-        client = Memic(api_key=api_key, base_url=base_url)
         projects = client.list_projects()
 
         assert len(projects) == 2
         assert projects[0].id == "proj-1"
         assert projects[0].name == "Project 1"
+        assert projects[0].organization_id == org_id
 
 
 class TestUploadFile:
     """Tests for upload_file method."""
 
-    @responses.activate
     def test_upload_file_success(
-        self, api_key: str, base_url: str, project_id: str, file_id: str
+        self,
+        mock_transport: requests_mock.Mocker,
+        client: Memic,
+        base_url: str,
+        project_id: str,
+        file_id: str,
     ) -> None:
         """upload_file completes 3-step flow."""
-        # Setup mocks
-        responses.add(
-            responses.POST,
-            f"{base_url}/sdk/files/init",
-            json={
-                "file_id": file_id,
-                "upload_url": "https://storage.example.com/upload",
-                "expires_in": 3600,
-            },
-            status=201,
+        upload_url = "https://storage.example.com/upload"
+        routes: Dict[Tuple[str, str], Tuple[int, Any]] = {
+            ("POST", f"{base_url}/sdk/files/init"): (
+                201,
+                {"file_id": file_id, "upload_url": upload_url, "expires_in": 3600},
+            ),
+            ("PUT", upload_url): (200, None),
+            ("POST", f"{base_url}/sdk/files/{file_id}/confirm"): (
+                200,
+                {
+                    "id": file_id,
+                    "name": "test.pdf",
+                    "original_filename": "test.pdf",
+                    "size": 1024,
+                    "mime_type": "application/pdf",
+                    "project_id": project_id,
+                    "status": "ready",
+                },
+            ),
+        }
+
+        def handler(request: Any, context: Any) -> Any:
+            context.status_code, body = routes[(request.method, request.url)]
+            return body
+
+        mock_transport.register_uri(requests_mock.ANY, requests_mock.ANY, json=handler)
+
+        file = client.upload_file(
+            io.BytesIO(b"test content"),
+            filename="test.pdf",
+            wait_for_ready=False,
         )
-        responses.add(
-            responses.PUT,
-            "https://storage.example.com/upload",
-            status=200,
+
+        assert file.id == file_id
+        assert file.status == FileStatus.READY
+
+        init_body = json.loads(mock_transport.request_history[0].body)
+        assert init_body["mime_type"] == "application/pdf"
+
+        put_request = mock_transport.request_history[1]
+        assert "X-API-Key" not in put_request.headers
+        assert put_request.headers["Content-Length"] == "12"
+        assert "Transfer-Encoding" not in put_request.headers
+
+    @pytest.mark.parametrize(
+        "source",
+        [b"test content", io.BytesIO(b"test content")],
+        ids=["bytes", "bytesio"],
+    )
+    def test_upload_file_from_memory(
+        self,
+        mock_transport: requests_mock.Mocker,
+        client: Memic,
+        base_url: str,
+        project_id: str,
+        file_id: str,
+        source: Any,
+    ) -> None:
+        """upload_file accepts bytes and file objects with an explicit filename."""
+        mock_transport.post(
+            f"{base_url}/sdk/files/init",
+            json={"file_id": file_id, "upload_url": "https://storage.example.com/upload"},
+            status_code=201,
         )
-        responses.add(
-            responses.POST,
+        mock_transport.put("https://storage.example.com/upload", status_code=200)
+        mock_transport.post(
             f"{base_url}/sdk/files/{file_id}/confirm",
-            json={
-                "id": file_id,
-                "name": "test.pdf",
-                "original_filename": "test.pdf",
-                "size": 1024,
-                "mime_type": "application/pdf",
-                "project_id": project_id,
-                "status": "ready",
-            },
-            status=200,
+            json={"id": file_id, "project_id": project_id, "status": "uploaded"},
+            status_code=200,
         )
 
-        # Create temp file
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"test content")
-            temp_path = f.name
+        file = client.upload_file(source, filename="report.pdf", wait_for_ready=False)
 
-        try:
-            client = Memic(api_key=api_key, base_url=base_url)
-            file = client.upload_file(
-                file_path=temp_path,
-                wait_for_ready=False,
-            )
+        assert file.id == file_id
+        init_body = json.loads(mock_transport.request_history[0].body)
+        assert init_body["filename"] == "report.pdf"
+        assert init_body["size"] == 12
+        assert init_body["mime_type"] == "application/pdf"
+        put_request = mock_transport.request_history[1]
+        assert put_request.headers["Content-Length"] == "12"
+        assert put_request.headers["Content-Type"] == "application/pdf"
+
+    def test_upload_file_bytes_without_filename_raises(self, client: Memic) -> None:
+        """Bytes have no name to infer, so filename is required."""
+        with pytest.raises(ValueError, match="filename is required"):
+            client.upload_file(b"test content", wait_for_ready=False)
+
+    def test_upload_file_fd_named_file_without_filename_raises(self, client: Memic) -> None:
+        """An integer fd in ``name`` is not a filename."""
+        with tempfile.TemporaryFile() as fileobj:
+            fileobj.write(b"test content")
+            fileobj.seek(0)
+            with pytest.raises(ValueError, match="filename is required"):
+                client.upload_file(fileobj, wait_for_ready=False)
+
+    def test_upload_file_non_seekable_raises(self, client: Memic) -> None:
+        """Streams that cannot report their size are rejected with a clear error."""
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        with open(read_fd, "rb") as pipe:
+            with pytest.raises(ValueError, match="seekable"):
+                client.upload_file(pipe, filename="a.pdf", wait_for_ready=False)
+
+    def test_upload_body_reports_progress(self) -> None:
+        """The streamed upload body reports cumulative progress per chunk."""
+        progress: List[Tuple[int, int]] = []
+        body = _UploadBody(
+            io.BytesIO(b"0123456789"),
+            10,
+            chunk_size=4,
+            progress_callback=lambda sent, total: progress.append((sent, total)),
+        )
 
-            assert file.id == file_id
-            assert file.status == FileStatus.READY
-        finally:
-            os.unlink(temp_path)
+        assert len(body) == 10
+        assert b"".join(body) == b"0123456789"
+        assert progress == [(4, 10), (8, 10), (10, 10)]
 
-    def test_upload_file_not_found(self, api_key: str) -> None:
+    def test_upload_file_not_found(self, client: Memic) -> None:
         """upload_file raises FileNotFoundError for missing file."""
-        client = Memic(api_key=api_key)
-
         with pytest.raises(FileNotFoundError, match="File not found"):
             client.upload_file(
                 file_path="/nonexistent/file.pdf",
             )
 
 
+class TestUploadFiles:
+    """Tests for upload_files method."""
+
+    def test_upload_files_preserves_order(
+        self,
+        mock_transport: requests_mock.Mocker,
+        tmp_path: Path,
+        client: Memic,
+        base_url: str,
+        project_id: str,
+    ) -> None:
+        """upload_files uploads every file and returns results in input order."""
+        names = ["a.pdf", "b.pdf", "c.pdf"]
+
+        def init_callback(request: Any, context: Any) -> Dict[str, str]:
+            name = request.json()["filename"]
+            return {"file_id": name, "upload_url": f"https://storage.example.com/{name}"}
+
+        mock_transport.post(f"{base_url}/sdk/files/init", json=init_callback, status_code=201)
+        for name in names:
+            mock_transport.put(f"https://storage.example.com/{name}", status_code=200)
+            mock_transport.post(
+                f"{base_url}/sdk/files/{name}/confirm",
+                json={
+                    "id": name,
+                    "name": name,
+                    "original_filename": name,
+                    "size": 1,
+                    "mime_type": "application/pdf",
+                    "project_id": project_id,
+                    "status": "uploaded",
+                },
+            )
+            (tmp_path / name).write_bytes(b"x")
+
+        files = client.upload_files(
+            [tmp_path / name for name in names], wait_for_ready=False, max_concurrency=3
+        )
+
+        assert [f.id for f in files] == names
+
+    def test_upload_files_concurrency_capped_at_pool_size(self, client: Memic) -> None:
+        """More workers than pooled upload connections would discard connections."""
+        with patch("memic.client.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            client.upload_files([], max_concurrency=100)
+
+        pool.assert_called_once_with(max_workers=Memic.UPLOAD_POOL_MAXSIZE)
+        assert Memic.UPLOAD_POOL_MAXSIZE <= Memic.DEFAULT_POOL_MAXSIZE
+
+    def test_upload_files_return_exceptions(self, client: Memic) -> None:
+        """return_exceptions puts failures in the result list instead of raising."""
+        results = client.upload_files(
+            ["/nonexistent/a.pdf", "/nonexistent/b.pdf"], return_exceptions=True
+        )
+
+        assert all(isinstance(r, FileNotFoundError) for r in results)
+
+    def test_upload_files_raises_by_default(self, client: Memic) -> None:
+        """The first failure is raised when return_exceptions is False."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            client.upload_files(["/nonexistent/a.pdf"])
+
+
 class TestGetFileStatus:
     """Tests for get_file_status method."""
 
-    @responses.activate
     def test_get_file_status_success(
-        self, api_key: str, base_url: str, project_id: str, file_id: str
+        self,
+        mock_transport: requests_mock.Mocker,
+        client: Memic,
+        base_url: str,
+        project_id: str,
+        file_id: str,
     ) -> None:
         """get_file_status returns File object."""
-        responses.add(
-            responses.GET,
+        mock_transport.get(
             f"{base_url}/sdk/files/{file_id}/status",
             json={
                 "id": file_id,
@@ -236,10 +591,9 @@ class TestGetFileStatus:
                 "status": "parsing_started",
                 "total_chunks": 5,
             },
-            status=200,
+            status_code=200,
         )
 
-        client = Memic(api_key=api_key, base_url=base_url)
         file = client.get_file_status(file_id)
 
         assert file.id == file_id
@@ -247,49 +601,293 @@ class TestGetFileStatus:
         assert file.status.is_processing is True
         assert file.status.is_failed is False
 
+    def test_get_file_status_long_poll(
+        self,
+        mock_transport: requests_mock.Mocker,
+        client: Memic,
+        base_url: str,
+        project_id: str,
+        file_id: str,
+    ) -> None:
+        """wait_seconds is sent as a long-poll query parameter."""
+        mock_transport.get(
+            f"{base_url}/sdk/files/{file_id}/status",
+            json={
+                "id": file_id,
+                "name": "test.pdf",
+                "original_filename": "test.pdf",
+                "size": 1024,
+                "mime_type": "application/pdf",
+                "project_id": project_id,
+                "status": "ready",
+            },
+            status_code=200,
+        )
+
+        client.get_file_status(file_id, wait_seconds=10)
+
+        assert mock_transport.request_history[-1].url.endswith("/status?wait=10")
+
+
+class TestWaitForReady:
+    """Tests for wait_for_ready polling."""
+
+    @staticmethod
+    def _status_body(file_id: str, project_id: str, status: str) -> dict:
+        return {
+            "id": file_id,
+            "name": "test.pdf",
+            "original_filename": "test.pdf",
+            "size": 1024,
+            "mime_type": "application/pdf",
+            "project_id": project_id,
+            "status": status,
+        }
+
+    def test_backoff_grows_and_resets_on_transition(
+        self,
+        mock_transport: requests_mock.Mocker,
+        client: Memic,
+        base_url: str,
+        project_id: str,
+        file_id: str,
+    ) -> None:
+        """Poll delay grows while status is unchanged and resets when it advances."""
+        url = f"{base_url}/sdk/files/{file_id}/status"
+        statuses = ["parsing_started"] * 3 + ["chunking_started", "ready"]
+        mock_transport.get(
+            url,
+            [{"json": self._status_body(file_id, project_id, status)} for status in statuses],
+        )
+
+        with patch("memic.client.time.sleep") as sleep, patch(
+            "memic.client.random.uniform", return_value=0.0
+        ):
+            file = client.wait_for_ready(file_id, poll_interval=2.0)
+
+        assert file.status == FileStatus.READY
+        delays = [c.args[0] for c in sleep.call_args_list]
+        assert delays == pytest.approx([2.0, 3.0, 4.5, 2.0], abs=0.05)
+
+    def test_backoff_capped(
+        self,
+        mock_transport: requests_mock.Mocker,
+        client: Memic,
+        base_url: str,
+        project_id: str,
+        file_id: str,
+    ) -> None:
+        """Poll delay never exceeds max_poll_interval."""
+        url = f"{base_url}/sdk/files/{file_id}/status"
+        statuses = ["embedding_started"] * 6 + ["ready"]
+        mock_transport.get(
+            url,
+            [{"json": self._status_body(file_id, project_id, status)} for status in statuses],
+        )
+
+        with patch("memic.client.time.sleep") as sleep, patch(
+            "memic.client.random.uniform", return_value=0.0
+        ):
+            client.wait_for_ready(file_id, poll_interval=2.0, max_poll_interval=5.0)
+
+        delays = [c.args[0] for c in sleep.call_args_list]
+        assert max(delays) == pytest.approx(5.0, abs=0.05)
+
+    def test_validates_file_only_when_ready(
+        self,
+        mock_transport: requests_mock.Mocker,
+        client: Memic,
+        base_url: str,
+        project_id: str,
+        file_id: str,
+    ) -> None:
+        """Intermediate polls skip File validation; only the final payload is validated."""
+        url = f"{base_url}/sdk/files/{file_id}/status"
+        statuses = ["uploaded", "parsing_started", "ready"]
+        mock_transport.get(
+            url,
+            [{"json": self._status_body(file_id, project_id, status)} for status in statuses],
+        )
+
+        with patch("memic.client.time.sleep"), patch.object(
+            File, "model_validate", wraps=File.model_validate
+        ) as validate:
+            file = client.wait_for_ready(file_id)
+
+        assert file.status == FileStatus.READY
+        assert validate.call_count == 1
+
+    def test_long_poll_time_counts_toward_delay(
+        self,
+        mock_transport: requests_mock.Mocker,
+        client: Memic,
+        base_url: str,
+        project_id: str,
+        file_id: str,
+    ) -> None:
+        """No extra sleep when the server already held the long-poll request."""
+        clock = [0.0]
+        statuses = iter(["parsing_started", "ready"])
+
+        def held_status(request: Any, context: Any) -> Dict[str, Any]:
+            assert request.qs["wait"] == ["30"]
+            clock[0] += 20.0  # server held the request
+            return self._status_body(file_id, project_id, next(statuses))
+
+        mock_transport.get(f"{base_url}/sdk/files/{file_id}/status", json=held_status)
+
+        with patch("memic.client.time.time", side_effect=lambda: clock[0]), patch(
+            "memic.client.time.sleep"
+        ) as sleep:
+            file = client.wait_for_ready(file_id)
+
+        assert file.status == FileStatus.READY
+        sleep.assert_not_called()
+
+    @pytest.mark.parametrize("poll_timeout,wait", [(300, 30), (60, 10), (10, 1)])
+    def test_long_poll_wait_leaves_room_for_retries(
+        self, client: Memic, poll_timeout: float, wait: int
+    ) -> None:
+        """Every retried attempt of a long-poll fits in the remaining poll_timeout."""
+        assert client._long_poll_wait(poll_timeout) == wait
+        attempts = client.DEFAULT_MAX_RETRIES + 1
+        if wait > 1:
+            assert attempts * (wait + client.LONG_POLL_GRACE) <= poll_timeout
+
+    @pytest.mark.parametrize("wait_seconds,timeout", [(1, 30), (10, 30), (30, 35)])
+    def test_long_poll_timeout_never_below_client_timeout(
+        self, client: Memic, file_id: str, wait_seconds: int, timeout: int
+    ) -> None:
+        """The read timeout covers the hold but keeps the configured timeout as a floor."""
+        with patch.object(client, "_request_url", return_value={}) as request_url:
+            client._request_file_status(file_id, wait_seconds=wait_seconds)
+
+        assert request_url.call_args.kwargs["timeout"] == timeout
+
+    def test_failed_status_raises(
+        self,
+        mock_transport: requests_mock.Mocker,
+        client: Memic,
+        base_url: str,
+        project_id: str,
+        file_id: str,
+    ) -> None:
+        """A failed status raises MemicError without further polling."""
+        body = self._status_body(file_id, project_id, "parsing_failed")
+        body["error_message"] = "corrupt PDF"
+        mock_transport.get(f"{base_url}/sdk/files/{file_id}/status", json=body)
+
+        with pytest.raises(MemicError, match="corrupt PDF"):
+            client.wait_for_ready(file_id)
+
+
+class TestBatchStatus:
+    """Tests for get_files_status and wait_for_all_ready."""
+
+    @staticmethod
+    def _file(file_id: str, project_id: str, status: str) -> dict:
+        return {
+            "id": file_id,
+            "name": f"{file_id}.pdf",
+            "original_filename": f"{file_id}.pdf",
+            "size": 1024,
+            "mime_type": "application/pdf",
+            "project_id": project_id,
+            "status": status,
+        }
+
+    def test_get_files_status_batch(
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str, project_id: str
+    ) -> None:
+        """get_files_status fetches all files in one bulk request."""
+        mock_transport.post(
+            f"{base_url}/sdk/files/status:batch",
+            json={
+                "items": [
+                    self._file("f1", project_id, "ready"),
+                    self._file("f2", project_id, "chunking_started"),
+                ]
+            },
+        )
+
+        statuses = client.get_files_status(["f1", "f2"])
+
+        assert mock_transport.call_count == 1
+        assert json.loads(mock_transport.request_history[0].body) == {"file_ids": ["f1", "f2"]}
+        assert statuses["f1"].status == FileStatus.READY
+        assert statuses["f2"].status == FileStatus.CHUNKING_STARTED
+
+    def test_get_files_status_falls_back(
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str, project_id: str
+    ) -> None:
+        """Without a bulk endpoint, per-file requests are used and remembered."""
+        mock_transport.post(f"{base_url}/sdk/files/status:batch", status_code=404)
+        for file_id in ("f1", "f2"):
+            mock_transport.get(
+                f"{base_url}/sdk/files/{file_id}/status",
+                json=self._file(file_id, project_id, "ready"),
+            )
+
+        assert set(client.get_files_status(["f1", "f2"])) == {"f1", "f2"}
+        assert set(client.get_files_status(["f1"])) == {"f1"}
+
+        batch_calls = [r for r in mock_transport.request_history if r.method == "POST"]
+        assert len(batch_calls) == 1
+        assert client._batch_status_supported is False
+
+    def test_wait_for_all_ready(
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str, project_id: str
+    ) -> None:
+        """wait_for_all_ready polls the batch and returns files in input order."""
+        url = f"{base_url}/sdk/files/status:batch"
+        mock_transport.post(
+            url,
+            [
+                {
+                    "json": {
+                        "items": [
+                            self._file("f1", project_id, "embedding_started"),
+                            self._file("f2", project_id, "ready"),
+                        ]
+                    }
+                },
+                {"json": {"items": [self._file("f1", project_id, "ready")]}},
+            ],
+        )
+
+        with patch("memic.client.time.sleep"):
+            files = client.wait_for_all_ready(["f1", "f2"])
+
+        assert [f.id for f in files] == ["f1", "f2"]
+        assert all(f.status == FileStatus.READY for f in files)
+        assert json.loads(mock_transport.request_history[1].body) == {"file_ids": ["f1"]}
+
+    def test_wait_for_all_ready_failure(
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str, project_id: str
+    ) -> None:
+        """Any failed file raises MemicError."""
+        failed = self._file("f2", project_id, "embedding_failed")
+        failed["error_message"] = "quota exceeded"
+        mock_transport.post(
+            f"{base_url}/sdk/files/status:batch",
+            json={"items": [self._file("f1", project_id, "parsing_started"), failed]},
+        )
+
+        with pytest.raises(MemicError, match="quota exceeded"):
+            client.wait_for_all_ready(["f1", "f2"])
+
 
 class TestSearch:
     """Tests for search method."""
 
-    @responses.activate
     def test_search_basic(
-        self, api_key: str, base_url: str, project_id: str
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str, project_id: str
     ) -> None:
         """search returns SearchResults with matching chunks."""
-        responses.add(
-            responses.POST,
-            f"{base_url}/sdk/search",
-            json={
-                "query": "test query",
-                "results": {
-                    "semantic": [
-                        {
-                            "chunk_id": "chunk-1",
-                            "file_id": "file-1",
-                            "file_name": "doc.pdf",
-                            "content": "This is the matching content",
-                            "score": 0.95,
-                            "chunk_index": 0,
-                            "page_number": 1,
-                        },
-                        {
-                            "chunk_id": "chunk-2",
-                            "file_id": "file-1",
-                            "file_name": "doc.pdf",
-                            "content": "Another match",
-                            "score": 0.85,
-                            "chunk_index": 1,
-                            "page_number": 2,
-                        },
-                    ],
-                },
-                "total_results": 2,
-                "search_time_ms": 125.5,
-            },
-            status=200,
+        mock_transport.post(
+            f"{base_url}/sdk/search", content=_SEARCH_BASIC_BYTES, headers=_JSON_HEADERS
         )
 
-        client = Memic(api_key=api_key, base_url=base_url)
         results = client.search(query="test query", project_id=project_id)
 
         assert isinstance(results, SearchResults)
@@ -299,19 +897,10 @@ class TestSearch:
         assert results[0].score == 0.95
         assert results[0].content == "This is the matching content"
 
-    @responses.activate
-    def test_search_with_filters(
-        self, api_key: str, base_url: str
-    ) -> None:
+    def test_search_with_filters(self, mock_request: _RequestRecorder, client: Memic) -> None:
         """search passes metadata filters correctly."""
-        responses.add(
-            responses.POST,
-            f"{base_url}/sdk/search",
-            json={"query": "test", "results": {"semantic": []}, "total_results": 0, "search_time_ms": 50.0},
-            status=200,
-        )
+        mock_request.response = json.loads(_SEARCH_EMPTY_BYTES)
 
-        client = Memic(api_key=api_key, base_url=base_url)
         filters = MetadataFilters(
             reference_id="TG_G1_Math",
             page_range=PageRange(gte=1, lte=50),
@@ -319,33 +908,14 @@ class TestSearch:
         client.search(query="test", filters=filters)
 
         # Check request body
-        request_body = responses.calls[-1].request.body
-        assert b"TG_G1_Math" in request_body
-        assert b"metadata_filters" in request_body
+        method, path, kwargs = mock_request.calls[-1]
+        assert (method, path) == ("POST", "/sdk/search")
+        assert kwargs["json"]["metadata_filters"]["reference_id"] == "TG_G1_Math"
 
-    @responses.activate
-    def test_search_iterable(
-        self, api_key: str, base_url: str
-    ) -> None:
+    def test_search_iterable(self, mock_request: _RequestRecorder, client: Memic) -> None:
         """SearchResults is iterable."""
-        responses.add(
-            responses.POST,
-            f"{base_url}/sdk/search",
-            json={
-                "query": "test",
-                "results": {
-                    "semantic": [
-                        {"chunk_id": "1", "file_id": "f1", "file_name": "a.pdf", "content": "A", "score": 0.9},
-                        {"chunk_id": "2", "file_id": "f2", "file_name": "b.pdf", "content": "B", "score": 0.8},
-                    ],
-                },
-                "total_results": 2,
-                "search_time_ms": 50.0,
-            },
-            status=200,
-        )
+        mock_request.response = json.loads(_SEARCH_TWO_RESULTS_BYTES)
 
-        client = Memic(api_key=api_key, base_url=base_url)
         results = client.search(query="test")
 
         # Test iteration
@@ -353,96 +923,160 @@ class TestSearch:
         assert contents == ["A", "B"]
 
 
-class TestExceptionHandling:
-    """Tests for exception handling."""
+class TestModelValidation:
+    """Tests for building models straight from API payloads."""
 
-    @responses.activate
-    def test_authentication_error_401(self, api_key: str, base_url: str) -> None:
-        """401 response raises AuthenticationError."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/sdk/me",
-            json={"detail": "Invalid API key"},
-            status=401,
-        )
+    def test_search_result_coerces_ids(self) -> None:
+        """Numeric IDs become strings and missing fields take defaults."""
+        result = SearchResult.model_validate({"chunk_id": 7, "file_id": 9, "project_id": 0})
 
-        client = Memic(api_key=api_key, base_url=base_url)
-        with pytest.raises(AuthenticationError, match="Invalid API key"):
-            _ = client.org_id
+        assert result.chunk_id == "7"
+        assert result.file_id == "9"
+        assert result.project_id is None
+        assert result.content == ""
+        assert result.score == 0.0
 
-    @responses.activate
-    def test_authentication_error_403(self, api_key: str, base_url: str) -> None:
-        """403 response raises AuthenticationError."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/sdk/me",
-            json={"detail": "Access denied"},
-            status=403,
+    def test_file_coerces_ids(self) -> None:
+        """File IDs are coerced to strings and status defaults to uploading."""
+        file = File.model_validate({"id": 42, "project_id": 3})
+
+        assert file.id == "42"
+        assert file.project_id == "3"
+        assert file.status == FileStatus.UPLOADING
+
+
+class TestStructuredSearch:
+    """Tests for structured results and routing in search responses."""
+
+    def test_search_structured_and_routing(
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str
+    ) -> None:
+        """Structured rows, column metadata and routing are parsed with defaults."""
+        mock_transport.post(
+            f"{base_url}/sdk/search", content=_SEARCH_STRUCTURED_BYTES, headers=_JSON_HEADERS
         )
 
-        client = Memic(api_key=api_key, base_url=base_url)
-        with pytest.raises(AuthenticationError, match="Access denied"):
+        results = client.search(query="revenue")
+
+        assert results.has_structured
+        assert results.structured is not None
+        assert [c.type for c in results.structured.columns] == ["unknown", "varchar"]
+        assert results.structured.rows == [{"total": 10, "region": "EU"}]
+        assert results.routing is not None
+        assert results.routing.route == "semantic"
+        assert results.routing.sql_generated == "SELECT 1"
+
+
+class TestExceptionHandling:
+    """Tests for exception handling."""
+
+    @pytest.mark.parametrize(
+        "code,exc,detail",
+        [
+            (401, AuthenticationError, "Invalid API key"),
+            (403, AuthenticationError, "Access denied"),
+            (500, APIError, "Internal server error"),
+        ],
+    )
+    def test_error_status_maps_to_exception(
+        self,
+        mock_transport: requests_mock.Mocker,
+        client: Memic,
+        base_url: str,
+        code: int,
+        exc: Type[MemicError],
+        detail: str,
+    ) -> None:
+        """Error responses raise the matching exception with the API's detail."""
+        mock_transport.get(f"{base_url}/sdk/me", json={"detail": detail}, status_code=code)
+
+        with pytest.raises(exc, match=detail) as exc_info:
             _ = client.org_id
 
-    @responses.activate
+        if isinstance(exc_info.value, APIError):
+            assert exc_info.value.status_code == code
+
     def test_not_found_error(
-        self, api_key: str, base_url: str
+        self, mock_transport: requests_mock.Mocker, client: Memic, base_url: str
     ) -> None:
         """404 response raises NotFoundError."""
-        responses.add(
-            responses.GET,
+        mock_transport.get(
             f"{base_url}/sdk/files/nonexistent/status",
             json={"detail": "File not found"},
-            status=404,
+            status_code=404,
         )
 
-        client = Memic(api_key=api_key, base_url=base_url)
         with pytest.raises(NotFoundError, match="File not found"):
             client.get_file_status("nonexistent")
 
-    @responses.activate
-    def test_api_error(self, api_key: str, base_url: str) -> None:
-        """500 response raises APIError."""
-        responses.add(
-            responses.GET,
-            f"{base_url}/sdk/me",
-            json={"detail": "Internal server error"},
-            status=500,
-        )
+    def test_transient_errors_retried(self, local_server: _LocalServer, org_id: str) -> None:
+        """Transient 503 responses are retried by the transport before surfacing."""
+        local_server.routes[("GET", "/sdk/me")] = [
+            (503, {"detail": "unavailable"}),
+            (200, {"organization_id": org_id}),
+        ]
 
-        client = Memic(api_key=api_key, base_url=base_url)
-        with pytest.raises(APIError) as exc_info:
-            _ = client.org_id
+        with Memic(api_key="mk_test_key_123", base_url=local_server.base_url) as client:
+            assert client.org_id == org_id
+
+        assert local_server.requests == [("GET", "/sdk/me")] * 2
+
+    @pytest.mark.parametrize("code,attempts", [(503, 2), (429, 2), (500, 1), (502, 1)])
+    def test_post_retried_only_when_refused(
+        self, local_server: _LocalServer, code: int, attempts: int
+    ) -> None:
+        """POSTs are replayed on 429/503 but not on statuses where they may have applied."""
+        local_server.routes[("POST", "/sdk/files/init")] = [
+            (code, {"detail": "boom"}),
+            (201, {"file_id": "f1", "upload_url": f"{local_server.base_url}/storage"}),
+        ]
+
+        with Memic(api_key="mk_test_key_123", base_url=local_server.base_url) as client:
+            with contextlib.suppress(APIError):
+                client._request("POST", "/sdk/files/init", json={"filename": "a.pdf"})
+
+        assert local_server.requests == [("POST", "/sdk/files/init")] * attempts
+
+    @pytest.mark.parametrize("header,expected", [("3600", 30.0), ("2", 2.0)])
+    def test_retry_after_is_capped(self, header: str, expected: float) -> None:
+        """A long Retry-After cannot block a call far past its timeout."""
+        response = urllib3.HTTPResponse(status=429, headers={"Retry-After": header})
 
-        assert exc_info.value.status_code == 500
+        assert _ApiRetry(total=3).get_retry_after(response) == expected
 
 
 class TestFileStatus:
     """Tests for FileStatus enum."""
 
-    def test_is_failed_true(self) -> None:
-        """is_failed returns True for failed statuses."""
-        assert FileStatus.UPLOAD_FAILED.is_failed is True
-        assert FileStatus.CONVERSION_FAILED.is_failed is True
-        assert FileStatus.PARSING_FAILED.is_failed is True
-        assert FileStatus.EMBEDDING_FAILED.is_failed is True
-
-    def test_is_failed_false(self) -> None:
-        """is_failed returns False for non-failed statuses."""
-        assert FileStatus.UPLOADING.is_failed is False
-        assert FileStatus.READY.is_failed is False
-        assert FileStatus.PARSING_STARTED.is_failed is False
-
-    def test_is_processing_true(self) -> None:
-        """is_processing returns True for processing statuses."""
-        assert FileStatus.UPLOADING.is_processing is True
-        assert FileStatus.PARSING_STARTED.is_processing is True
-        assert FileStatus.EMBEDDING_STARTED.is_processing is True
-
-    def test_is_processing_false(self) -> None:
-        """is_processing returns False for terminal statuses."""
-        assert FileStatus.READY.is_processing is False
-        assert FileStatus.UPLOAD_FAILED.is_processing is False
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (FileStatus.UPLOAD_FAILED, True),
+            (FileStatus.CONVERSION_FAILED, True),
+            (FileStatus.PARSING_FAILED, True),
+            (FileStatus.EMBEDDING_FAILED, True),
+            (FileStatus.UPLOADING, False),
+            (FileStatus.READY, False),
+            (FileStatus.PARSING_STARTED, False),
+        ],
+    )
+    def test_is_failed(self, status: FileStatus, expected: bool) -> None:
+        """is_failed is True only for failed statuses."""
+        assert status.is_failed is expected
+
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (FileStatus.UPLOADING, True),
+            (FileStatus.PARSING_STARTED, True),
+            (FileStatus.EMBEDDING_STARTED, True),
+            (FileStatus.READY, False),
+            (FileStatus.UPLOAD_FAILED, False),
+        ],
+    )
+    def test_is_processing(self, status: FileStatus, expected: bool) -> None:
+        """is_processing is False once a status is terminal."""
+        assert status.is_processing is expected
 
 
 class TestMetadataFilters:
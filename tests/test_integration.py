@@ -11,29 +11,86 @@ Run:
   # Against production
   MEMIC_API_KEY=mk_live_... pytest tests/test_integration.py -v
 
+  # Replay /sdk/me and /sdk/projects from a local cache on quick re-runs
+  MEMIC_TEST_CACHE=1 MEMIC_API_KEY=mk_live_... pytest tests/test_integration.py -v
+
 All tests are skipped automatically if MEMIC_API_KEY is not set,
 so running `pytest` in CI without the env var is safe.
 """
 
 import os
-import tempfile
-from pathlib import Path
+from typing import Iterator
 
 import pytest
 
-from memic import Memic, SearchResults
+from memic import File, Memic, SearchResults
+
+# Seconds a cached GET is replayed for when MEMIC_TEST_CACHE=1
+CACHE_TTL = 60
+
+# Skip entire module if no API key is configured; the shared backend is
+# never hit from more than one pytest-xdist worker
+pytestmark = [
+    pytest.mark.skipif(
+        not os.environ.get("MEMIC_API_KEY"),
+        reason="MEMIC_API_KEY not set — skipping integration tests",
+    ),
+    pytest.mark.serial,
+]
+
+
+@pytest.fixture(scope="module")
+def client(pytestconfig: pytest.Config) -> Memic:
+    """Create a real Memic client from env vars.
+
+    With MEMIC_TEST_CACHE=1, context and project GETs are replayed from a
+    local SQLite cache for a minute so quick re-runs skip those round trips.
+    Everything else (status polls included) always hits the backend.
+    """
+    client = Memic()  # reads MEMIC_API_KEY and MEMIC_BASE_URL from env
+    if os.environ.get("MEMIC_TEST_CACHE") == "1":
+        import requests_cache
+
+        session = requests_cache.CachedSession(
+            str(pytestconfig.cache.mkdir("memic-http") / "http_cache"),
+            backend="sqlite",
+            allowable_methods=["GET"],
+            # The same base URL answers differently per key
+            match_headers=["X-API-Key"],
+            urls_expire_after={
+                "*/sdk/me": CACHE_TTL,
+                "*/sdk/projects": CACHE_TTL,
+                "*": requests_cache.DO_NOT_CACHE,
+            },
+        )
+        session.headers.update(client._session.headers)
+        for prefix, adapter in client._session.adapters.items():
+            session.mount(prefix, adapter)
+        client._session = session
 
-# Skip entire module if no API key is configured
-pytestmark = pytest.mark.skipif(
-    not os.environ.get("MEMIC_API_KEY"),
-    reason="MEMIC_API_KEY not set — skipping integration tests",
-)
+    # Resolve org/project/environment in one /sdk/me call up front so
+    # property reads in tests are plain attribute lookups
+    client._ensure_context()
+    return client
 
 
 @pytest.fixture(scope="module")
-def client() -> Memic:
-    """Create a real Memic client from env vars."""
-    return Memic()  # reads MEMIC_API_KEY and MEMIC_BASE_URL from env
+def ready_file(client: Memic, tmp_path_factory: pytest.TempPathFactory) -> Iterator[File]:
+    """Upload one small file, wait until READY, and delete it after the module."""
+    temp_path = tmp_path_factory.mktemp("upload") / "integration.txt"
+    temp_path.write_text("Integration test content for Memic SDK.")
+
+    # Upload (with CI-friendly timeout)
+    file = client.upload_file(
+        file_path=temp_path,
+        wait_for_ready=True,
+        poll_timeout=90,
+    )
+
+    yield file
+
+    # Clean up — delete the file
+    client._request("DELETE", f"/sdk/files/{file.id}")
 
 
 class TestSDKMe:
@@ -141,18 +198,9 @@ class TestSDKFiles:
         assert response["page"] == 1
         assert response["page_size"] == 5
 
-    def test_get_file_status(self, client: Memic) -> None:
-        """Get file status for a known file (from list)."""
-        files_response = client._request(
-            "GET",
-            "/sdk/files",
-            params={"page": 1, "page_size": 1},
-        )
-        if files_response["total"] == 0:
-            pytest.skip("No files in environment — cannot test file status")
-
-        file_id = files_response["items"][0]["id"]
-        status_response = client._request("GET", f"/sdk/files/{file_id}/status")
+    def test_get_file_status(self, client: Memic, ready_file: File) -> None:
+        """Get file status for the module's uploaded file."""
+        status_response = client._request("GET", f"/sdk/files/{ready_file.id}/status")
         assert "id" in status_response, (
             f"Missing 'id' in file status response. "
             f"Got keys: {list(status_response.keys())}"
@@ -163,33 +211,13 @@ class TestSDKFiles:
 class TestSDKFileLifecycle:
     """Test /sdk/files (init → upload → confirm → status → delete)."""
 
-    def test_upload_and_delete(self, client: Memic) -> None:
-        """Full file lifecycle: upload a small file, wait for ready, then delete."""
-        # Create a tiny test file
-        with tempfile.NamedTemporaryFile(
-            suffix=".txt", delete=False, mode="w"
-        ) as f:
-            f.write("Integration test content for Memic SDK.")
-            temp_path = f.name
-
-        try:
-            # Upload (with CI-friendly timeout)
-            file = client.upload_file(
-                file_path=temp_path,
-                wait_for_ready=True,
-                poll_timeout=90,
-            )
-            assert file.id is not None, "Uploaded file has no ID"
-            assert file.status.value == "ready", (
-                f"Expected status 'ready', got '{file.status.value}'"
-            )
-
-            # Verify status endpoint works
-            status = client.get_file_status(file.id)
-            assert status.id == file.id
-
-            # Clean up — delete the file
-            client._request("DELETE", f"/sdk/files/{file.id}")
+    def test_upload_and_delete(self, client: Memic, ready_file: File) -> None:
+        """Full file lifecycle: the uploaded file is ready (deleted on teardown)."""
+        assert ready_file.id is not None, "Uploaded file has no ID"
+        assert ready_file.status.value == "ready", (
+            f"Expected status 'ready', got '{ready_file.status.value}'"
+        )
 
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        # Verify status endpoint works
+        status = client.get_file_status(ready_file.id)
+        assert status.id == ready_file.id
@@ -0,0 +1,39 @@
+"""Tests for how the test suite itself is scheduled under pytest-xdist."""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).parent
+
+
+def test_integration_tests_share_one_worker() -> None:
+    """Serial tests land on a single worker with ``--dist loadgroup``."""
+    env = {k: v for k, v in os.environ.items() if k != "MEMIC_API_KEY"}
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            str(TESTS_DIR / "test_integration.py"),
+            "-n",
+            "2",
+            "--dist",
+            "loadgroup",
+            "-v",
+            "-p",
+            "no:cacheprovider",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=TESTS_DIR.parent,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    placements = re.findall(r"^\[(gw\d+)\].*::(\S+)", result.stdout, re.MULTILINE)
+    assert placements, result.stdout
+    assert len({worker for worker, _ in placements}) == 1
+    assert all(node_id.endswith("@backend") for _, node_id in placements)